@@ -7,43 +7,471 @@ of a local Firecrawl instance, including web scraping, crawling, and data extrac
 """
 
 import os
+import re
 import sys
 import json
 import time
+import uuid
+import random
+import subprocess
+import asyncio
 import threading
-import requests
-from typing import Dict, Any, List, Optional, Union, Callable
+import httpx
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import contextmanager
+from functools import lru_cache
+from operator import itemgetter
+from email.utils import parsedate_to_datetime
+from urllib.parse import unquote_plus, urlparse, urlsplit, urlunparse
+from typing import Dict, Any, Awaitable, BinaryIO, FrozenSet, Iterator, List, Optional, Set, Tuple, Union, Callable, TypeVar
 from datetime import datetime
-from rich.console import Console
+from rich.console import Console, Group
 from rich.panel import Panel
-from rich.text import Text
-from rich.markdown import Markdown
 from rich.table import Table
 from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn, TimeElapsedColumn
 from rich.prompt import Prompt, Confirm
-from rich.syntax import Syntax
-from rich.live import Live
 from rich import box
-from rich.layout import Layout
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the standard library
+    orjson = None
 
 # Configuration
 DEFAULT_API_URL = "http://localhost:3002"
 DEFAULT_TEST_URL = "https://firecrawl.dev"
+DEFAULT_REQUEST_TIMEOUT = 120.0
+CRAWL_DISPLAY_LIMIT = 500
+MAP_DISPLAY_LIMIT = 500
+SCRAPE_PREVIEW_LINES = 100
+# Exports larger than this (in characters) are viewed through the system pager
+VIEW_PAGER_THRESHOLD = 1 << 20
+# At most this many bytes of an export are read for viewing
+VIEW_MAX_BYTES = 2 << 20
+EXPORT_WRITE_BUFFER = 1 << 20
+
+# File extension for each export format; names already ending in one are kept as-is
+EXPORT_EXTENSIONS = {"markdown": ".md", "html": ".html", "json": ".json", "text": ".txt"}
+KNOWN_EXPORT_EXTENSIONS = frozenset(EXPORT_EXTENSIONS.values())
+
+# Repeat scrape/map calls within these many seconds are served from memory (0 disables)
+CACHE_TTL_SCRAPE = float(os.environ.get("CACHE_TTL_SCRAPE", "600"))
+CACHE_TTL_MAP = float(os.environ.get("CACHE_TTL_MAP", "600"))
+CACHE_MAX_ENTRIES = 256
+
+WELCOME_TEXT = """
+# Welcome to Firecrawl Explorer
+
+This application allows you to interact with your local Firecrawl instance and explore its capabilities.
+
+## Features:
+- 🔍 **Scrape URL**: Extract content from a single webpage
+- 🕸️ **Crawl Website**: Crawl an entire website and extract content from all pages
+- 🗺️ **Map Website**: Discover all links on a website
+- 📚 **Batch Scrape**: Scrape many URLs concurrently from a website map, a list or a text file
+
+## Getting Started:
+1. Use the menu to navigate between different features
+2. Configure your Firecrawl API URL in the Settings if needed
+3. Start exploring the capabilities of your Firecrawl instance!
+"""
+
+HELP_TEXT = """
+## Keyboard Shortcuts:
+- `1`: Go to Scrape URL
+- `2`: Go to Crawl Website
+- `3`: Go to Map Website
+- `4`: Go to Settings
+- `5`: Show this help
+- `6`: Manage Exports
+- `7`: Batch Scrape
+- `q`: Quit the application
+
+## About Firecrawl:
+Firecrawl is an API service that takes a URL, crawls it, and converts it into clean markdown or structured data. It crawls all accessible subpages and gives you clean data for each.
+
+## Self-hosted Instance:
+You are currently using a self-hosted instance of Firecrawl. This means that all data processing happens locally on your machine.
+
+## Export System:
+The export system organizes your data into different categories:
+- **Scrapes**: Single page scraping results
+- **Crawls**: Multi-page crawling results
+- **Maps**: Website mapping results
+- **Docs**: Documentation and guides
+- **Custom**: Any other exports
+"""
+
+# Responses worth retrying: rate limiting and a restarting/overloaded server
+RETRY_STATUS_CODES = frozenset({429, 502, 503, 504})
+# Starting a crawl is only retried when rate limited. Firecrawl rate-limits before
+# it records the idempotency key, but a 5xx may arrive after the job was accepted,
+# and a retry carrying the same key is then rejected with 409.
+CRAWL_START_RETRY_STATUS_CODES = frozenset({429})
+MAX_RETRIES = 5
+CONNECT_RETRIES = 3
+RETRY_BASE_DELAY = 0.5
+RETRY_MAX_DELAY = 30.0
+
+T = TypeVar("T")
+
+
+def _json_loads(data: Union[bytes, str]) -> Any:
+    """Parse JSON with orjson when available."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _json_dumpb(data: Any, indent: bool = False) -> bytes:
+    """Serialize JSON to UTF-8 bytes with orjson when available, keeping non-ASCII characters as-is."""
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if indent else 0)
+        return orjson.dumps(data, option=option)
+    return json.dumps(data, indent=2 if indent else None, ensure_ascii=False).encode("utf-8")
+
+
+def _parse_retry_after(retry_after: Optional[str]) -> Optional[float]:
+    """
+    Parse a Retry-After header given either in seconds or as an HTTP date.
+    
+    Args:
+        retry_after: The header value, if any.
+        
+    Returns:
+        The requested delay in seconds, capped at RETRY_MAX_DELAY, or None if the
+        header is missing or malformed.
+    """
+    if not retry_after:
+        return None
+    
+    try:
+        delay = float(retry_after)
+    except ValueError:
+        try:
+            delay = parsedate_to_datetime(retry_after).timestamp() - time.time()
+        except (TypeError, ValueError):
+            return None
+    
+    return min(max(delay, 0.0), RETRY_MAX_DELAY)
+
+def _retry_delay(attempt: int, retry_after: Optional[str]) -> float:
+    """
+    Compute how long to wait before retrying a request.
+    
+    Args:
+        attempt: Zero-based number of the attempt that just failed.
+        retry_after: The response's Retry-After header, if any.
+        
+    Returns:
+        The server-requested delay if a Retry-After header was sent, otherwise a
+        capped exponential backoff with random jitter.
+    """
+    delay = _parse_retry_after(retry_after)
+    if delay is not None:
+        return delay
+    
+    return min(RETRY_MAX_DELAY, RETRY_BASE_DELAY * 2 ** attempt) + random.uniform(0, RETRY_BASE_DELAY)
+
+
+def _crawl_status_fields(page: Dict[str, Any]) -> Dict[str, Any]:
+    """Return a crawl status response without its `data` and `next` fields."""
+    return {key: value for key, value in page.items() if key not in ("data", "next")}
+
+
+def _parse_crawl_status(response: httpx.Response) -> Tuple[Dict[str, Any], Optional[float]]:
+    """
+    Parse a lightweight crawl status poll.
+    
+    Args:
+        response: The response to a crawl status request.
+        
+    Returns:
+        The status without `data` and `next`, and the delay in seconds the server
+        asked for via Retry-After, or None if it sent none.
+    """
+    status = _crawl_status_fields(_json_loads(response.content))
+    return status, _parse_retry_after(response.headers.get("Retry-After"))
+
+
+def _merge_crawl_page(results: Dict[str, Any], data: List[Dict[str, Any]], page: Dict[str, Any],
+                      max_items: Optional[int], api_url: str, crawl_id: str) -> bool:
+    """
+    Merge one page of crawl results into the results downloaded so far.
+    
+    Args:
+        results: The status fields collected so far, filled from the first page.
+        data: The result items collected so far; the page's items are appended.
+        page: The crawl results page to merge.
+        max_items: Maximum number of result items to keep. None keeps them all.
+        api_url: Base URL of the Firecrawl API, used to build the continuation link.
+        crawl_id: The ID of the crawl job.
+        
+    Returns:
+        True once max_items is reached, after cutting data down to max_items and
+        pointing results["next"] at the remaining items.
+    """
+    if not results:
+        results.update(_crawl_status_fields(page))
+    
+    data.extend(page.get("data", []))
+    
+    if max_items is None or len(data) < max_items:
+        return False
+    
+    # The server's next link only fits when the cut falls on a page boundary
+    if len(data) > max_items:
+        results["next"] = f"{api_url}/v1/crawl/{crawl_id}?skip={max_items}"
+    elif page.get("next"):
+        results["next"] = page["next"]
+    del data[max_items:]
+    return True
+
+
+def _json_search_needle(term: str) -> Optional[bytes]:
+    """
+    Lowercased bytes of term as it would appear inside a JSON string.
+    
+    Returns None when JSON encoding would escape the term (non-ASCII, quotes,
+    backslashes, control characters), as a raw byte scan could then miss it.
+    """
+    if not term.isascii() or json.dumps(term)[1:-1] != term:
+        return None
+    return term.lower().encode()
+
+
+def _sidecar_name(filename: str) -> str:
+    """
+    Name of the .meta.json sidecar for an export file name.
+    
+    Equivalent to os.path.splitext(filename)[0] + ".meta.json" for a bare file
+    name (leading dots do not start an extension), without its per-call overhead.
+    """
+    stem, dot, _ = filename.rpartition(".")
+    if dot and stem.lstrip("."):
+        return f"{stem}.meta.json"
+    return f"{filename}.meta.json"
+
+
+def _file_contains(path: str, needle: bytes) -> bool:
+    """Whether a file's lowercased bytes contain needle; False if it cannot be read."""
+    try:
+        with open(path, "rb") as f:
+            return needle in f.read().lower()
+    except OSError:
+        return False
+
+
+_CSV_SPLIT = re.compile(r"\s*,\s*")
+
+def _parse_csv(value: str) -> List[str]:
+    """Split a comma-separated prompt answer into its non-empty, stripped items."""
+    return [item for item in _CSV_SPLIT.split(value.strip()) if item]
+
+
+@lru_cache(maxsize=1024)
+def _url_to_domain(url: str) -> str:
+    """Return the lowercase host name of a URL (which may omit its scheme), or 'unknown'."""
+    return urlsplit(url if "//" in url else f"//{url}").hostname or "unknown"
+
+
+# Query parameters that only track where a visitor came from
+TRACKING_QUERY_PARAMS = frozenset({"fbclid", "gclid", "msclkid", "mc_cid", "mc_eid"})
+
+
+def _is_tracking_param(key: str) -> bool:
+    """Whether a query parameter name only tracks where a visitor came from."""
+    key = key.lower()
+    return key.startswith("utm_") or key in TRACKING_QUERY_PARAMS
+
+
+def _canonicalize_url(url: str) -> str:
+    """
+    Normalize a URL so that trivially different links to the same page compare equal.
+    
+    The scheme and host are lowercased, the fragment and trailing slash are
+    dropped, and tracking parameters (utm_* and common click IDs) are removed
+    from the query. Other query parameters are kept since they often select
+    distinct pages (e.g. ?page=2).
+    
+    Args:
+        url: The URL to normalize.
+        
+    Returns:
+        The canonical form of the URL.
+    """
+    parts = urlparse(url)
+    # Drop tracking segments but leave the rest of the query byte-for-byte, since
+    # re-encoding it (e.g. ?flag -> ?flag=, a/b -> a%2Fb) can point at another page
+    query = "&".join(
+        segment for segment in parts.query.split("&")
+        if not _is_tracking_param(unquote_plus(segment.partition("=")[0]))
+    )
+    return urlunparse((parts.scheme.lower(), parts.netloc.lower(), parts.path.rstrip("/") or "/", parts.params, query, ""))
+
+
+def _dedupe_urls(urls: List[str]) -> Tuple[List[str], Dict[str, str]]:
+    """
+    Remove duplicate URLs by their canonical form, keeping the first occurrence's position.
+    
+    Args:
+        urls: The URLs to deduplicate.
+        
+    Returns:
+        The unique canonical URLs and a mapping of every rewritten original URL to its canonical form.
+    """
+    canonical_map = {url: _canonicalize_url(url) for url in urls}
+    unique = list(dict.fromkeys(canonical_map[url] for url in urls))
+    return unique, {original: canonical for original, canonical in canonical_map.items() if original != canonical}
+
+
+def _interleave_by_host(urls: List[str]) -> List[int]:
+    """
+    Order URL indices round-robin across hosts.
+    
+    Batches are usually dominated by a single site; interleaving spreads the
+    first requests of a batch over every host instead of queueing them all
+    behind one host's politeness delay.
+    
+    Args:
+        urls: The URLs to order.
+        
+    Returns:
+        The indices of `urls` in interleaved order.
+    """
+    buckets: Dict[str, List[int]] = {}
+    for index, url in enumerate(urls):
+        buckets.setdefault(_url_to_domain(url), []).append(index)
+    
+    order = []
+    queues = list(buckets.values())
+    for position in range(max((len(queue) for queue in queues), default=0)):
+        order.extend(queue[position] for queue in queues if position < len(queue))
+    return order
+
+class TTLCache:
+    """A small thread-safe LRU cache whose entries expire after a fixed time."""
+    
+    def __init__(self, maxsize: int = CACHE_MAX_ENTRIES, ttl: float = 600.0):
+        """
+        Initialize the cache.
+        
+        Args:
+            maxsize: Maximum number of entries; the least recently used is evicted first.
+            ttl: Lifetime of an entry in seconds. 0 or less disables caching.
+        """
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries: "OrderedDict[Any, Tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+    
+    def __len__(self) -> int:
+        """Return the number of unexpired entries, dropping expired ones."""
+        with self._lock:
+            return self._prune()
+    
+    def _prune(self) -> int:
+        """Drop expired entries and return how many remain. The lock must be held."""
+        now = time.monotonic()
+        for key in [key for key, (expires_at, _) in self._entries.items() if expires_at <= now]:
+            del self._entries[key]
+        return len(self._entries)
+    
+    def get(self, key: Any, default: Any = None) -> Any:
+        """Return the unexpired value cached under key, or default."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return default
+            
+            expires_at, value = entry
+            if expires_at <= time.monotonic():
+                del self._entries[key]
+                return default
+            
+            self._entries.move_to_end(key)
+            return value
+    
+    def set(self, key: Any, value: Any) -> None:
+        """Cache value under key for ttl seconds."""
+        if self.ttl <= 0:
+            return
+        
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+    
+    def clear(self) -> int:
+        """Drop every entry and return how many unexpired ones there were."""
+        with self._lock:
+            count = self._prune()
+            self._entries.clear()
+            return count
+
+# Parsed export sidecars keyed by (path, mtime_ns). A rewritten sidecar gets a new
+# key, so entries never go stale and do not expire; only the LRU bound applies.
+_export_metadata_cache = TTLCache(maxsize=4096, ttl=float("inf"))
+
+
+def _cached_export_metadata(path: str, mtime_ns: int) -> Optional[Dict[str, Any]]:
+    """Return an export sidecar's parsed metadata if it is cached, without touching the disk."""
+    return _export_metadata_cache.get((path, mtime_ns))
+
+
+def _load_export_metadata(path: str, mtime_ns: int) -> Dict[str, Any]:
+    """Load an export's .meta.json sidecar, from cache while it is unchanged."""
+    metadata = _cached_export_metadata(path, mtime_ns)
+    if metadata is None:
+        with open(path, "rb") as f:
+            metadata = _json_loads(f.read())
+        _export_metadata_cache.set((path, mtime_ns), metadata)
+    return metadata
+
 
 class FirecrawlClient:
     """Client for interacting with the Firecrawl API."""
     
-    def __init__(self, api_url: str = DEFAULT_API_URL, api_key: Optional[str] = None):
+    # Export directories already created during this process, shared by all clients
+    _ensured_dirs: Set[str] = set()
+    
+    def __init__(self, api_url: str = DEFAULT_API_URL, api_key: Optional[str] = None, console: Optional[Console] = None):
         """
         Initialize the Firecrawl client.
         
         Args:
             api_url: The URL of the Firecrawl API.
             api_key: Optional API key for authentication.
+            console: Optional console to share with the caller; a new one is created by default.
         """
         self.api_url = api_url
         self.api_key = api_key
-        self.console = Console()
+        self.console = console or Console()
+        
+        # Reuse one HTTP/2 connection pool across calls (notably the status polling
+        # loop). No custom transport is passed so httpx keeps honoring the
+        # HTTP(S)_PROXY environment variables; failed connects and retryable status
+        # codes are handled by _request_with_retry. httpx advertises br/zstd
+        # compression whenever the brotli/zstandard packages are installed to decode it.
+        self.session = httpx.Client(
+            headers=self._prepare_headers(),
+            http2=True,
+            limits=httpx.Limits(max_connections=50, max_keepalive_connections=20),
+            timeout=DEFAULT_REQUEST_TIMEOUT
+        )
+        
+        self._scrape_cache = TTLCache(ttl=CACHE_TTL_SCRAPE)
+        self._map_cache = TTLCache(ttl=CACHE_TTL_MAP)
+        
+        # Set by cancel_wait to wake up crawl polling from any thread
+        self._cancel = threading.Event()
+        
+        # One progress display, built on first use, shared by all concurrent crawl waits
+        self._progress: Optional[Progress] = None
+        self._progress_users = 0
+        self._progress_lock = threading.Lock()
     
     def _prepare_headers(self, idempotency_key: Optional[str] = None) -> Dict[str, str]:
         """Prepare headers for API requests."""
@@ -54,6 +482,146 @@ class FirecrawlClient:
             headers["x-idempotency-key"] = idempotency_key
         return headers
     
+    def close(self) -> None:
+        """Close the underlying session and its pooled connections."""
+        self.session.close()
+    
+    def cancel_wait(self) -> None:
+        """Stop any in-progress wait_for_crawl_completion/wait_for_many call, from any thread."""
+        self._cancel.set()
+    
+    def clear_cache(self) -> int:
+        """Forget all cached scrape and map responses and return how many there were."""
+        return self._scrape_cache.clear() + self._map_cache.clear()
+    
+    def cache_size(self) -> int:
+        """Return the number of unexpired cached scrape and map responses."""
+        return len(self._scrape_cache) + len(self._map_cache)
+    
+    def _cached_call(self, cache: TTLCache, url: str, params: Dict[str, Any], call: Callable[[Dict[str, Any]], T]) -> T:
+        """
+        Serve a scrape/map request from cache, or make it and cache the result.
+        
+        Args:
+            cache: The cache for this endpoint.
+            url: The requested URL.
+            params: The request parameters. A truthy "bypassCache" entry skips the
+                cache lookup (the fresh result is still cached) and is not sent.
+            call: Makes the request with the given parameters.
+            
+        Returns:
+            The cached or fresh result.
+        """
+        params = dict(params)
+        bypass = params.pop("bypassCache", False)
+        key = (url, json.dumps(params, sort_keys=True))
+        
+        if not bypass:
+            cached = cache.get(key)
+            if cached is not None:
+                return cached
+        
+        result = call(params)
+        cache.set(key, result)
+        return result
+    
+    def _request_with_retry(
+        self,
+        method: str,
+        url: str,
+        max_retries: int = MAX_RETRIES,
+        retry_statuses: FrozenSet[int] = RETRY_STATUS_CODES,
+        **kwargs
+    ) -> httpx.Response:
+        """
+        Send a request, retrying transient failures (429/502/503/504 by default).
+        
+        Failed connection attempts are retried up to CONNECT_RETRIES times on top
+        of that; nothing reached the server, so resending is always safe.
+        
+        Args:
+            method: The HTTP method.
+            url: The URL to request.
+            max_retries: Maximum number of retries after the first attempt.
+            retry_statuses: The status codes that are retried.
+            **kwargs: Passed through to the session's request method.
+            
+        Returns:
+            The first non-transient response, or the last response once retries run out.
+        """
+        attempt = 0
+        connect_failures = 0
+        
+        while True:
+            try:
+                response = self.session.request(method, url, **kwargs)
+            except httpx.ConnectError:
+                if connect_failures == CONNECT_RETRIES:
+                    raise
+                time.sleep(_retry_delay(connect_failures, None))
+                connect_failures += 1
+                continue
+            
+            if response.status_code not in retry_statuses or attempt == max_retries:
+                return response
+            
+            time.sleep(_retry_delay(attempt, response.headers.get("Retry-After")))
+            attempt += 1
+    
+    def _send(
+        self,
+        method: str,
+        endpoint: str,
+        action: str,
+        json_body: Optional[Dict[str, Any]] = None,
+        params: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None,
+        retry_statuses: FrozenSet[int] = RETRY_STATUS_CODES
+    ) -> httpx.Response:
+        """
+        Send a request to an API endpoint, raising unless it succeeds.
+        
+        Args:
+            method: The HTTP method.
+            endpoint: The endpoint path (e.g. "/v1/scrape") or an absolute URL.
+            action: What the call does, used in error messages (e.g. "Scrape").
+            json_body: Optional JSON request body.
+            params: Optional query string parameters.
+            headers: Optional extra headers for this request.
+            retry_statuses: The status codes that are retried.
+            
+        Returns:
+            The successful response.
+        """
+        url = endpoint if endpoint.startswith(("http://", "https://")) else f"{self.api_url}{endpoint}"
+        # Bodies are pre-encoded (with orjson when available); the session already sends the JSON Content-Type
+        content = None if json_body is None else _json_dumpb(json_body)
+        response = self._request_with_retry(
+            method, url, content=content, params=params, headers=headers, retry_statuses=retry_statuses
+        )
+        
+        if response.status_code != 200:
+            raise Exception(f"{action} failed with status code {response.status_code}: {response.text}")
+        
+        return response
+    
+    def _call(self, method: str, endpoint: str, action: str, extract: Optional[str] = None, **kwargs) -> Any:
+        """
+        Call an API endpoint and decode its JSON response.
+        
+        Args:
+            method: The HTTP method.
+            endpoint: The endpoint path or an absolute URL.
+            action: What the call does, used in error messages.
+            extract: Optional top-level key of the response to return instead of the whole response.
+            **kwargs: Passed through to _send (json_body, params, headers, retry_statuses).
+            
+        Returns:
+            The decoded response, or its `extract` value ({} if missing).
+        """
+        data = _json_loads(self._send(method, endpoint, action, **kwargs).content)
+        return data.get(extract, {}) if extract else data
+    
     def scrape_url(self, url: str, params: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """
         Scrape a URL using the Firecrawl API.
@@ -66,30 +634,21 @@ class FirecrawlClient:
                 includeTags: List of HTML tags to include
                 excludeTags: List of HTML tags to exclude
                 waitFor: Time to wait for JavaScript to load in milliseconds
+                bypassCache: Fetch a fresh result instead of one cached within CACHE_TTL_SCRAPE seconds
                 
         Returns:
             The scrape response.
         """
-        endpoint = "/v1/scrape"
-        headers = self._prepare_headers()
-        
         # Default parameters if none provided
         if params is None:
             params = {"formats": ["markdown"]}
         
-        json_data = {"url": url}
-        json_data.update(params)
-        
-        response = requests.post(
-            f"{self.api_url}{endpoint}",
-            headers=headers,
-            json=json_data
+        return self._cached_call(
+            self._scrape_cache,
+            url,
+            params,
+            lambda params: self._call("POST", "/v1/scrape", "Scrape", json_body={"url": url, **params}, extract="data")
         )
-        
-        if response.status_code == 200:
-            return response.json().get("data", {})
-        else:
-            raise Exception(f"Scrape failed with status code {response.status_code}: {response.text}")
     
     def crawl_url(self, url: str, params: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """
@@ -108,194 +667,925 @@ class FirecrawlClient:
                 scrapeOptions: Options for scraping each page
             
         Returns:
-            The crawl initiation response.
+            The crawl initiation response.
+        """
+        # Default parameters if none provided
+        if params is None:
+            params = {}
+        
+        # Only rate-limited attempts are retried, as they never reach the idempotency check
+        return self._call(
+            "POST",
+            "/v1/crawl",
+            "Crawl initiation",
+            json_body={"url": url, **params},
+            headers=self._prepare_headers(idempotency_key=str(uuid.uuid4())),
+            retry_statuses=CRAWL_START_RETRY_STATUS_CODES
+        )
+    
+    def check_crawl_status(self, crawl_id: str) -> Dict[str, Any]:
+        """
+        Check the status of a crawl job.
+        
+        Args:
+            crawl_id: The ID of the crawl job.
+            
+        Returns:
+            The crawl status response.
+        """
+        return self._call("GET", f"/v1/crawl/{crawl_id}", "Status check")
+    
+    def check_crawl_status_light(self, crawl_id: str) -> Dict[str, Any]:
+        """
+        Check the status of a crawl job without downloading its results.
+        
+        Only a single result item is requested (limit=0 means "no limit" to the
+        Firecrawl API) and it is dropped along with the pagination link, leaving
+        the status, completed/total counters and credit usage.
+        
+        Args:
+            crawl_id: The ID of the crawl job.
+            
+        Returns:
+            The crawl status response without `data` and `next`.
+        """
+        return self._poll_crawl_status(crawl_id)[0]
+    
+    def _poll_crawl_status(self, crawl_id: str) -> Tuple[Dict[str, Any], Optional[float]]:
+        """
+        Fetch the lightweight crawl status along with the server's polling hint.
+        
+        Args:
+            crawl_id: The ID of the crawl job.
+            
+        Returns:
+            The status (as check_crawl_status_light) and the delay in seconds the
+            server asked for via Retry-After, or None if it sent none.
+        """
+        response = self._send("GET", f"/v1/crawl/{crawl_id}", "Status check", params={"skip": 0, "limit": 1})
+        return _parse_crawl_status(response)
+    
+    def map_url(self, url: str, params: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """
+        Map a URL to discover all links.
+        
+        Args:
+            url: The URL to map.
+            params: Additional parameters for the map request.
+                search: Search query to filter results
+                ignoreSitemap: Ignore the website sitemap (default: true)
+                sitemapOnly: Only return links from sitemap (default: false)
+                includeSubdomains: Include subdomains (default: false)
+                limit: Maximum number of links to return (default: 5000)
+                timeout: Timeout in milliseconds
+                bypassCache: Fetch a fresh result instead of one cached within CACHE_TTL_MAP seconds
+            
+        Returns:
+            The map response.
+        """
+        # Default parameters if none provided
+        if params is None:
+            params = {}
+        
+        return self._cached_call(
+            self._map_cache,
+            url,
+            params,
+            lambda params: self._call("POST", "/v1/map", "Map", json_body={"url": url, **params})
+        )
+
+    def wait_for_crawl_completion(
+        self,
+        crawl_id: str,
+        max_wait_seconds: float = 1800,
+        initial_interval: float = 1.0,
+        max_interval: float = 30.0,
+        backoff_factor: float = 1.5,
+        max_items: Optional[int] = None
+    ) -> Dict[str, Any]:
+        """
+        Wait for a crawl job to complete.
+        
+        The status is polled with truncated exponential backoff: the first check
+        happens immediately, the second initial_interval seconds later, and the
+        delay grows by backoff_factor after every incomplete poll, up to max_interval. A Retry-After header on a
+        status response overrides the next delay. Polls only fetch the status
+        counters; the crawl results are downloaded once, after completion.
+        
+        Args:
+            crawl_id: The ID of the crawl job.
+            max_wait_seconds: Maximum total time in seconds to wait for the crawl.
+            initial_interval: Delay in seconds before the second status check.
+            max_interval: Upper bound in seconds for the delay between status checks.
+            backoff_factor: Multiplier applied to the delay after each incomplete poll.
+            max_items: Maximum number of result items to download once the crawl
+                has completed (see fetch_crawl_results). None downloads them all.
+            
+        Returns:
+            The final crawl status response including its results.
+            
+        Raises:
+            KeyboardInterrupt: If the wait is cancelled with cancel_wait.
+        """
+        self._cancel.clear()
+        
+        with self._crawl_progress() as progress:
+            task = progress.add_task("[cyan]Waiting for crawl to complete...", total=max_wait_seconds)
+            try:
+                self._poll_until_complete(
+                    crawl_id,
+                    progress,
+                    task,
+                    "[cyan]Waiting for crawl to complete...",
+                    max_wait_seconds,
+                    initial_interval,
+                    max_interval,
+                    backoff_factor
+                )
+            finally:
+                progress.remove_task(task)
+        
+        return self.fetch_crawl_results(crawl_id, max_items=max_items)
+    
+    def wait_for_many(
+        self,
+        crawl_ids: List[str],
+        max_wait_seconds: float = 1800,
+        max_items: Optional[int] = None
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Wait for several crawl jobs to complete, polling them in parallel.
+        
+        Each crawl is polled (and its results downloaded) in its own worker thread
+        over the shared session, with one progress bar per crawl.
+        
+        Args:
+            crawl_ids: The IDs of the crawl jobs.
+            max_wait_seconds: Maximum total time in seconds to wait for each crawl.
+            max_items: Maximum number of result items to download per crawl. None
+                downloads them all.
+            
+        Returns:
+            The final crawl status of each crawl (as wait_for_crawl_completion) keyed
+            by its ID, or {"error": message} for crawls that failed or timed out.
+            
+        Raises:
+            KeyboardInterrupt: If the wait is cancelled with cancel_wait or Ctrl+C.
+        """
+        crawl_ids = list(dict.fromkeys(crawl_ids))
+        results: Dict[str, Dict[str, Any]] = {}
+        if not crawl_ids:
+            return results
+        
+        def wait_one(crawl_id: str, task: int) -> Dict[str, Any]:
+            label = f"[cyan]Crawl {crawl_id}"
+            self._poll_until_complete(crawl_id, progress, task, label, max_wait_seconds)
+            return self.fetch_crawl_results(crawl_id, max_items=max_items)
+        
+        self._cancel.clear()
+        
+        with self._crawl_progress() as progress:
+            # Progress tasks are added and removed from this thread; the workers only update them
+            tasks = {crawl_id: progress.add_task(f"[cyan]Crawl {crawl_id}", total=max_wait_seconds) for crawl_id in crawl_ids}
+            
+            try:
+                with ThreadPoolExecutor(max_workers=min(20, len(crawl_ids))) as executor:
+                    futures = {executor.submit(wait_one, crawl_id, task): crawl_id for crawl_id, task in tasks.items()}
+                    
+                    try:
+                        for future in as_completed(futures):
+                            try:
+                                results[futures[future]] = future.result()
+                            except Exception as e:
+                                results[futures[future]] = {"error": str(e)}
+                    except BaseException:
+                        # Wake the remaining workers so the executor can shut down
+                        self._cancel.set()
+                        raise
+            finally:
+                for task in tasks.values():
+                    progress.remove_task(task)
+        
+        return {crawl_id: results[crawl_id] for crawl_id in crawl_ids}
+    
+    @contextmanager
+    def _crawl_progress(self) -> Iterator[Progress]:
+        """
+        Show the shared crawl progress display for the duration of a wait.
+        
+        The display is built once per client and reference counted, so concurrent
+        waits share it: it starts with the first waiter and stops (clearing itself)
+        with the last. Each waiter adds and removes its own tasks.
+        """
+        with self._progress_lock:
+            if self._progress is None:
+                self._progress = Progress(
+                    SpinnerColumn(),
+                    TextColumn("[progress.description]{task.description}"),
+                    BarColumn(),
+                    TextColumn("[progress.percentage]{task.percentage:>3.0f}%"),
+                    TimeElapsedColumn(),
+                    console=self.console,
+                    transient=True
+                )
+            if self._progress_users == 0:
+                self._progress.start()
+            self._progress_users += 1
+        
+        try:
+            yield self._progress
+        finally:
+            with self._progress_lock:
+                self._progress_users -= 1
+                if self._progress_users == 0:
+                    self._progress.stop()
+    
+    def _poll_until_complete(
+        self,
+        crawl_id: str,
+        progress: Progress,
+        task: int,
+        label: str,
+        max_wait_seconds: float,
+        initial_interval: float = 1.0,
+        max_interval: float = 30.0,
+        backoff_factor: float = 1.5
+    ) -> None:
+        """
+        Poll a crawl job until it completes, updating its progress task.
+        
+        See wait_for_crawl_completion for the polling schedule.
+        
+        Raises:
+            Exception: If the crawl fails, is cancelled or does not complete in time.
+            KeyboardInterrupt: If the wait is cancelled with cancel_wait.
+        """
+        interval = initial_interval
+        start_time = time.monotonic()
+        deadline = start_time + max_wait_seconds
+        
+        while True:
+            status, retry_after = self._poll_crawl_status(crawl_id)
+            
+            if status.get("status") == "completed":
+                progress.update(task, completed=max_wait_seconds)
+                return
+            if status.get("status") in ("failed", "cancelled"):
+                raise Exception(f"Crawl {crawl_id} ended with status '{status.get('status')}'")
+            
+            now = time.monotonic()
+            if now >= deadline:
+                raise Exception(f"Crawl did not complete within {max_wait_seconds:g} seconds")
+            
+            progress.update(
+                task,
+                completed=now - start_time,
+                description=f"{label} ({status.get('completed', 0)}/{status.get('total', '?')} pages)"
+            )
+            if self._cancel.wait(min(interval if retry_after is None else retry_after, deadline - now)):
+                raise KeyboardInterrupt("Crawl wait cancelled")
+            interval = min(interval * backoff_factor, max_interval)
+
+    def iter_crawl_pages(self, crawl_id: str) -> Iterator[Dict[str, Any]]:
+        """
+        Iterate over the pages of a crawl job's results.
+        
+        Firecrawl splits large results across several responses linked by a
+        `next` URL; this follows those links so only one page is held in memory.
+        
+        Args:
+            crawl_id: The ID of the crawl job.
+            
+        Yields:
+            Each crawl status response page in order.
+        """
+        url = f"{self.api_url}/v1/crawl/{crawl_id}"
+        
+        while url:
+            page = self._call("GET", url, "Status check")
+            yield page
+            url = page.get("next")
+    
+    def fetch_crawl_results(self, crawl_id: str, max_items: Optional[int] = None) -> Dict[str, Any]:
+        """
+        Download the results of a crawl job, following pagination.
+        
+        Args:
+            crawl_id: The ID of the crawl job.
+            max_items: Maximum number of result items to download. None downloads them all.
+            
+        Returns:
+            The crawl status response with all downloaded items in `data`. `next` is
+            only present when the results were cut short by max_items.
+        """
+        results: Dict[str, Any] = {}
+        data: List[Dict[str, Any]] = []
+        
+        for page in self.iter_crawl_pages(crawl_id):
+            if _merge_crawl_page(results, data, page, max_items, self.api_url, crawl_id):
+                break
+        
+        results["data"] = data
+        return results
+    
+    def _open_export_file(self, directory: str, filename: str, format_type: str) -> Tuple[str, BinaryIO]:
+        """
+        Create a new export file for binary writing.
+        
+        Relative directories are resolved against the script's directory, the
+        directory is created if needed, an extension matching format_type is added
+        when missing, and a numeric suffix is appended if the file already exists.
+        Files are created exclusively, so concurrent saves never overwrite each other.
+        
+        Args:
+            directory: The directory to save the file in.
+            filename: The name of the file.
+            format_type: The format of the data (markdown, html, text, json).
+            
+        Returns:
+            The full path of the created file and the file opened for writing.
+        """
+        # Handle relative paths and ensure directory exists
+        if not os.path.isabs(directory):
+            # If not an absolute path, make it relative to the script's directory
+            script_dir = os.path.dirname(os.path.abspath(__file__))
+            directory = os.path.join(script_dir, directory)
+        
+        # Create directory if it doesn't exist
+        if directory not in self._ensured_dirs:
+            os.makedirs(directory, exist_ok=True)
+            self._ensured_dirs.add(directory)
+        
+        # Add appropriate extension if not provided
+        if os.path.splitext(filename)[1] not in KNOWN_EXPORT_EXTENSIONS:
+            filename += EXPORT_EXTENSIONS.get(format_type, ".txt")
+        
+        # Create full path
+        full_path = os.path.join(directory, filename)
+        
+        try:
+            return full_path, open(full_path, "xb", buffering=EXPORT_WRITE_BUFFER)
+        except FileExistsError:
+            pass
+        except FileNotFoundError:
+            # The directory was removed after it was ensured; recreate it and retry once
+            os.makedirs(directory, exist_ok=True)
+            return full_path, open(full_path, "xb", buffering=EXPORT_WRITE_BUFFER)
+        
+        # On conflict, continue after the highest existing counter found in one directory scan
+        base_name, extension = os.path.splitext(filename)
+        pattern = re.compile(rf"^{re.escape(base_name)}_(\d+){re.escape(extension)}$")
+        with os.scandir(directory) as entries:
+            matches = (pattern.match(entry.name) for entry in entries)
+            counter = max((int(match.group(1)) for match in matches if match), default=0)
+        
+        # Another save may claim the same name first; keep counting until one is free
+        while True:
+            counter += 1
+            full_path = os.path.join(directory, f"{base_name}_{counter}{extension}")
+            try:
+                return full_path, open(full_path, "xb", buffering=EXPORT_WRITE_BUFFER)
+            except FileExistsError:
+                continue
+    
+    def save_to_file(self, data: Any, directory: str, filename: str, format_type: str = "text") -> str:
+        """
+        Save data to a file in the specified directory with the given filename.
+        
+        Args:
+            data: The data to save.
+            directory: The directory to save the file in.
+            filename: The name of the file.
+            format_type: The format of the data (markdown, html, text, json).
+            
+        Returns:
+            The full path to the saved file.
+        """
+        full_path, f = self._open_export_file(directory, filename, format_type)
+        
+        # Save data to file as already-encoded bytes in a single write
+        with f:
+            if isinstance(data, (bytes, bytearray)):
+                f.write(data)
+            elif isinstance(data, str):
+                f.write(data.encode("utf-8"))
+            elif format_type == "json":
+                f.write(_json_dumpb(data, indent=True))
+            else:
+                f.write(str(data).encode("utf-8"))
+        
+        return full_path
+    
+    def save_crawl_stream(self, crawl_id: str, directory: str, filename: str) -> str:
+        """
+        Stream a crawl job's results into a JSON file page by page.
+        
+        The file has the same shape as a saved crawl status response, but pages
+        are written as they are fetched instead of being collected in memory first.
+        
+        Args:
+            crawl_id: The ID of the crawl job.
+            directory: The directory to save the file in.
+            filename: The name of the file.
+            
+        Returns:
+            The full path to the saved file.
+        """
+        full_path, f = self._open_export_file(directory, filename, "json")
+        
+        # A failed page request must not leave a truncated, invalid export behind
+        try:
+            with f:
+                first_item = True
+                
+                for page_number, page in enumerate(self.iter_crawl_pages(crawl_id)):
+                    if page_number == 0:
+                        # Write the status fields, then open the data array
+                        status = _crawl_status_fields(page)
+                        header = _json_dumpb(status)[:-1]
+                        f.write(header + (b", " if status else b"") + b'"data": [\n')
+                    
+                    for item in page.get("data", []):
+                        if not first_item:
+                            f.write(b",\n")
+                        f.write(_json_dumpb(item))
+                        first_item = False
+                
+                f.write(b"\n]}\n")
+        except BaseException:
+            os.remove(full_path)
+            raise
+        
+        return full_path
+
+class AutoScaledPool:
+    """
+    Concurrency limiter that adapts to how well the server is keeping up.
+    
+    Tasks run while fewer than `desired_concurrency` are in flight. After every
+    `scale_interval` completions the recent window of results is evaluated: the
+    pool grows by one slot while errors are rare and latency stays close to the
+    best observed, and shrinks to 70% when errors become frequent (e.g. 429/5xx
+    responses from an overloaded server).
+    """
+    
+    def __init__(
+        self,
+        desired_concurrency: int = 5,
+        min_concurrency: int = 1,
+        max_concurrency: int = 50,
+        window_size: int = 50,
+        scale_interval: int = 10,
+        latency_tolerance: float = 1.5
+    ):
+        """
+        Initialize the pool.
+        
+        Args:
+            desired_concurrency: Number of concurrent tasks to start with.
+            min_concurrency: Lower bound for the number of concurrent tasks.
+            max_concurrency: Upper bound for the number of concurrent tasks.
+            window_size: Number of recent completions used to evaluate the pool.
+            scale_interval: Number of completions between two scaling decisions.
+            latency_tolerance: How far the window's p95 latency may exceed the best
+                p95 seen so far before the pool stops growing.
+        """
+        self.min_concurrency = min_concurrency
+        self.max_concurrency = max(max_concurrency, min_concurrency)
+        self.desired_concurrency = min(max(desired_concurrency, self.min_concurrency), self.max_concurrency)
+        self.scale_interval = scale_interval
+        self.latency_tolerance = latency_tolerance
+        self._in_flight = 0
+        self._completions = 0
+        self._best_p95: Optional[float] = None
+        self._window: deque = deque(maxlen=window_size)
+        self._condition = asyncio.Condition()
+    
+    async def run(self, task: Callable[[], Awaitable[T]], failed: Optional[Callable[[T], bool]] = None) -> T:
+        """
+        Run a task once the pool has a free slot.
+        
+        Args:
+            task: Zero-argument callable returning the awaitable to run.
+            failed: Optional predicate marking a returned result as an error
+                (e.g. a 429 response), so it counts against the pool like an exception.
+            
+        Returns:
+            The task's result. Exceptions propagate to the caller and count as errors.
+        """
+        async with self._condition:
+            await self._condition.wait_for(lambda: self._in_flight < self.desired_concurrency)
+            self._in_flight += 1
+        
+        start = time.monotonic()
+        succeeded = False
+        try:
+            result = await task()
+            succeeded = failed is None or not failed(result)
+            return result
+        finally:
+            async with self._condition:
+                self._in_flight -= 1
+                self._record(time.monotonic() - start, succeeded)
+                self._condition.notify_all()
+    
+    def _record(self, latency: float, succeeded: bool) -> None:
+        """Record a completion and rescale every scale_interval completions."""
+        self._window.append((latency, succeeded))
+        self._completions += 1
+        
+        if self._completions % self.scale_interval:
+            return
+        
+        error_rate = sum(1 for _, ok in self._window if not ok) / len(self._window)
+        latencies = sorted(latency for latency, ok in self._window if ok)
+        
+        if error_rate > 0.1:
+            self.desired_concurrency = max(self.min_concurrency, int(self.desired_concurrency * 0.7))
+        elif error_rate < 0.02 and latencies:
+            p95 = latencies[min(len(latencies) - 1, int(len(latencies) * 0.95))]
+            if self._best_p95 is None or p95 < self._best_p95:
+                self._best_p95 = p95
+            if p95 <= self._best_p95 * self.latency_tolerance:
+                self.desired_concurrency = min(self.max_concurrency, self.desired_concurrency + 1)
+
+
+class AsyncFirecrawlClient:
+    """Asynchronous client for the Firecrawl API, used for concurrent batch operations."""
+    
+    def __init__(
+        self,
+        api_url: str = DEFAULT_API_URL,
+        api_key: Optional[str] = None,
+        crawl_delay_per_host: float = 0.0
+    ):
+        """
+        Initialize the asynchronous Firecrawl client.
+        
+        A single HTTP/2 connection pool is shared by every request made through
+        this client, so many calls can be awaited concurrently with asyncio.gather.
+        
+        Args:
+            api_url: The URL of the Firecrawl API.
+            api_key: Optional API key for authentication.
+            crawl_delay_per_host: Minimum delay in seconds between two requests
+                targeting the same host. Requests to different hosts are not delayed.
+        """
+        self.api_url = api_url
+        self.api_key = api_key
+        self.crawl_delay_per_host = crawl_delay_per_host
+        self._host_locks: Dict[str, asyncio.Lock] = {}
+        self._host_last: Dict[str, float] = {}
+        self.session = httpx.AsyncClient(
+            base_url=api_url,
+            headers=self._prepare_headers(),
+            http2=True,
+            limits=httpx.Limits(max_connections=50, max_keepalive_connections=20),
+            timeout=DEFAULT_REQUEST_TIMEOUT
+        )
+    
+    async def __aenter__(self) -> "AsyncFirecrawlClient":
+        return self
+    
+    async def __aexit__(self, *exc_info) -> None:
+        await self.aclose()
+    
+    async def aclose(self) -> None:
+        """Close the underlying HTTP connection pool."""
+        await self.session.aclose()
+    
+    def _prepare_headers(self, idempotency_key: Optional[str] = None) -> Dict[str, str]:
+        """Prepare headers for API requests."""
+        headers = {"Content-Type": "application/json"}
+        if self.api_key:
+            headers["Authorization"] = f"Bearer {self.api_key}"
+        if idempotency_key:
+            headers["x-idempotency-key"] = idempotency_key
+        return headers
+    
+    async def _request_with_retry(
+        self,
+        method: str,
+        url: str,
+        max_retries: int = MAX_RETRIES,
+        retry_statuses: FrozenSet[int] = RETRY_STATUS_CODES,
+        **kwargs
+    ) -> httpx.Response:
+        """
+        Send a request, retrying transient failures (429/502/503/504 by default).
+        
+        Args:
+            method: The HTTP method.
+            url: The URL to request.
+            max_retries: Maximum number of retries after the first attempt.
+            retry_statuses: The status codes that are retried.
+            **kwargs: Passed through to httpx.AsyncClient.request.
+            
+        Returns:
+            The first non-transient response, or the last response once retries run out.
+        """
+        for attempt in range(max_retries + 1):
+            response = await self.session.request(method, url, **kwargs)
+            
+            if response.status_code not in retry_statuses or attempt == max_retries:
+                return response
+            
+            await asyncio.sleep(_retry_delay(attempt, response.headers.get("Retry-After")))
+        
+        return response
+    
+    async def _send(
+        self,
+        method: str,
+        endpoint: str,
+        action: str,
+        json_body: Optional[Dict[str, Any]] = None,
+        params: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None,
+        retry_statuses: FrozenSet[int] = RETRY_STATUS_CODES
+    ) -> httpx.Response:
+        """Send a request to an API endpoint, raising unless it succeeds (see FirecrawlClient._send)."""
+        content = None if json_body is None else _json_dumpb(json_body)
+        response = await self._request_with_retry(
+            method, endpoint, content=content, params=params, headers=headers, retry_statuses=retry_statuses
+        )
+        
+        if response.status_code != 200:
+            raise Exception(f"{action} failed with status code {response.status_code}: {response.text}")
+        
+        return response
+    
+    async def _call(self, method: str, endpoint: str, action: str, extract: Optional[str] = None, **kwargs) -> Any:
+        """Call an API endpoint and decode its JSON response (see FirecrawlClient._call)."""
+        data = _json_loads((await self._send(method, endpoint, action, **kwargs)).content)
+        return data.get(extract, {}) if extract else data
+    
+    async def _wait_for_host(self, url: str) -> None:
+        """Delay until at least crawl_delay_per_host seconds have passed since the last request to url's host."""
+        if self.crawl_delay_per_host <= 0:
+            return
+        
+        host = _url_to_domain(url)
+        lock = self._host_locks.setdefault(host, asyncio.Lock())
+        
+        async with lock:
+            elapsed = time.monotonic() - self._host_last.get(host, float("-inf"))
+            if elapsed < self.crawl_delay_per_host:
+                await asyncio.sleep(self.crawl_delay_per_host - elapsed)
+            self._host_last[host] = time.monotonic()
+    
+    async def scrape_url(self, url: str, params: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """
+        Scrape a URL using the Firecrawl API.
+        
+        Args:
+            url: The URL to scrape.
+            params: Additional parameters for the scrape request (see FirecrawlClient.scrape_url).
+            
+        Returns:
+            The scrape response.
+        """
+        if params is None:
+            params = {"formats": ["markdown"]}
+        
+        await self._wait_for_host(url)
+        return await self._call("POST", "/v1/scrape", "Scrape", json_body={"url": url, **params}, extract="data")
+    
+    async def crawl_url(self, url: str, params: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """
+        Initiate a crawl job for the specified URL.
+        
+        Args:
+            url: The URL to crawl.
+            params: Additional parameters for the crawl request (see FirecrawlClient.crawl_url).
+            
+        Returns:
+            The crawl initiation response.
+        """
+        if params is None:
+            params = {}
+        
+        await self._wait_for_host(url)
+        # Only rate-limited attempts are retried, as they never reach the idempotency check
+        return await self._call(
+            "POST",
+            "/v1/crawl",
+            "Crawl initiation",
+            json_body={"url": url, **params},
+            headers=self._prepare_headers(idempotency_key=str(uuid.uuid4())),
+            retry_statuses=CRAWL_START_RETRY_STATUS_CODES
+        )
+    
+    async def check_crawl_status(self, crawl_id: str) -> Dict[str, Any]:
+        """
+        Check the status of a crawl job.
+        
+        Args:
+            crawl_id: The ID of the crawl job.
+            
+        Returns:
+            The crawl status response.
+        """
+        return await self._call("GET", f"/v1/crawl/{crawl_id}", "Status check")
+    
+    async def check_crawl_status_light(self, crawl_id: str) -> Dict[str, Any]:
+        """
+        Check the status of a crawl job without downloading its results.
+        
+        Args:
+            crawl_id: The ID of the crawl job.
+            
+        Returns:
+            The crawl status response without `data` and `next`.
+        """
+        return (await self._poll_crawl_status(crawl_id))[0]
+    
+    async def _poll_crawl_status(self, crawl_id: str) -> Tuple[Dict[str, Any], Optional[float]]:
+        """Fetch the lightweight crawl status and Retry-After hint (see FirecrawlClient._poll_crawl_status)."""
+        response = await self._send("GET", f"/v1/crawl/{crawl_id}", "Status check", params={"skip": 0, "limit": 1})
+        return _parse_crawl_status(response)
+    
+    async def fetch_crawl_results(self, crawl_id: str, max_items: Optional[int] = None) -> Dict[str, Any]:
+        """
+        Download the results of a crawl job, following pagination.
+        
+        Args:
+            crawl_id: The ID of the crawl job.
+            max_items: Maximum number of result items to download. None downloads them all.
+            
+        Returns:
+            The crawl status response with all downloaded items in `data`. `next` is
+            only present when the results were cut short by max_items.
         """
-        endpoint = "/v1/crawl"
-        headers = self._prepare_headers()
-        
-        # Default parameters if none provided
-        if params is None:
-            params = {}
-        
-        json_data = {"url": url}
-        json_data.update(params)
+        results: Dict[str, Any] = {}
+        data: List[Dict[str, Any]] = []
+        url: Optional[str] = f"/v1/crawl/{crawl_id}"
         
-        response = requests.post(
-            f"{self.api_url}{endpoint}",
-            headers=headers,
-            json=json_data
-        )
+        while url:
+            page = await self._call("GET", url, "Status check")
+            if _merge_crawl_page(results, data, page, max_items, self.api_url, crawl_id):
+                break
+            url = page.get("next")
         
-        if response.status_code == 200:
-            return response.json()
-        else:
-            raise Exception(f"Crawl initiation failed with status code {response.status_code}: {response.text}")
+        results["data"] = data
+        return results
     
-    def check_crawl_status(self, crawl_id: str) -> Dict[str, Any]:
+    async def _async_monitor_job_status(
+        self,
+        crawl_id: str,
+        interval: float = 1.0,
+        max_interval: float = 30.0,
+        backoff_factor: float = 1.5,
+        max_wait_seconds: float = 1800
+    ) -> Dict[str, Any]:
         """
-        Check the status of a crawl job.
+        Wait for a crawl job to finish without blocking the event loop.
+        
+        Sleeps with asyncio.sleep between lightweight status checks, so any number
+        of crawls can be monitored concurrently. The schedule matches
+        FirecrawlClient.wait_for_crawl_completion: the first check happens
+        immediately, then the delay backs off exponentially (or lasts as long as
+        a Retry-After header asks).
         
         Args:
             crawl_id: The ID of the crawl job.
+            interval: Delay in seconds before the second status check.
+            max_interval: Upper bound in seconds for the delay between status checks.
+            backoff_factor: Multiplier applied to the delay after each incomplete poll.
+            max_wait_seconds: Maximum total time in seconds to wait for the crawl.
             
         Returns:
-            The crawl status response.
+            The final crawl status response without results.
         """
-        endpoint = f"/v1/crawl/{crawl_id}"
-        headers = self._prepare_headers()
+        deadline = time.monotonic() + max_wait_seconds
         
-        response = requests.get(
-            f"{self.api_url}{endpoint}",
-            headers=headers
-        )
+        while True:
+            status, retry_after = await self._poll_crawl_status(crawl_id)
+            
+            if status.get("status") == "completed":
+                return status
+            if status.get("status") in ("failed", "cancelled"):
+                raise Exception(f"Crawl {crawl_id} ended with status '{status.get('status')}'")
+            
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise Exception(f"Crawl did not complete within {max_wait_seconds:g} seconds")
+            
+            await asyncio.sleep(min(interval if retry_after is None else retry_after, remaining))
+            interval = min(interval * backoff_factor, max_interval)
+    
+    async def wait_for_crawl_completion(
+        self,
+        crawl_id: str,
+        max_wait_seconds: float = 1800,
+        max_items: Optional[int] = None
+    ) -> Dict[str, Any]:
+        """
+        Wait for a crawl job to complete and download its results.
         
-        if response.status_code == 200:
-            return response.json()
-        else:
-            raise Exception(f"Status check failed with status code {response.status_code}: {response.text}")
+        Args:
+            crawl_id: The ID of the crawl job.
+            max_wait_seconds: Maximum total time in seconds to wait for the crawl.
+            max_items: Maximum number of result items to download. None downloads them all.
+            
+        Returns:
+            The final crawl status response including its results.
+        """
+        await self._async_monitor_job_status(crawl_id, max_wait_seconds=max_wait_seconds)
+        return await self.fetch_crawl_results(crawl_id, max_items=max_items)
     
-    def map_url(self, url: str, params: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    async def map_url(self, url: str, params: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """
         Map a URL to discover all links.
         
         Args:
             url: The URL to map.
-            params: Additional parameters for the map request.
-                search: Search query to filter results
-                ignoreSitemap: Ignore the website sitemap (default: true)
-                sitemapOnly: Only return links from sitemap (default: false)
-                includeSubdomains: Include subdomains (default: false)
-                limit: Maximum number of links to return (default: 5000)
-                timeout: Timeout in milliseconds
+            params: Additional parameters for the map request (see FirecrawlClient.map_url).
             
         Returns:
             The map response.
         """
-        endpoint = "/v1/map"
-        headers = self._prepare_headers()
-        
-        # Default parameters if none provided
         if params is None:
             params = {}
         
-        json_data = {"url": url}
-        json_data.update(params)
-        
-        response = requests.post(
-            f"{self.api_url}{endpoint}",
-            headers=headers,
-            json=json_data
-        )
-        
-        if response.status_code == 200:
-            return response.json()
-        else:
-            raise Exception(f"Map failed with status code {response.status_code}: {response.text}")
-
-    def wait_for_crawl_completion(self, crawl_id: str, poll_interval: int = 2, max_attempts: int = 30) -> Dict[str, Any]:
+        await self._wait_for_host(url)
+        return await self._call("POST", "/v1/map", "Map", json_body={"url": url, **params})
+    
+    async def _scrape_attempt(self, url: str, params: Dict[str, Any]) -> httpx.Response:
+        """Send a single scrape request without retries, for callers that schedule retries themselves."""
+        await self._wait_for_host(url)
+        return await self.session.request("POST", "/v1/scrape", content=_json_dumpb({"url": url, **params}))
+    
+    async def scrape_urls(
+        self,
+        urls: List[str],
+        params: Optional[Dict[str, Any]] = None,
+        concurrency: int = 10,
+        pool: Optional[AutoScaledPool] = None
+    ) -> List[Dict[str, Any]]:
         """
-        Wait for a crawl job to complete.
+        Scrape several URLs concurrently.
         
-        Args:
-            crawl_id: The ID of the crawl job.
-            poll_interval: Time in seconds between status checks.
-            max_attempts: Maximum number of status check attempts.
-            
-        Returns:
-            The final crawl status response.
-        """
-        attempts = 0
-        
-        with Progress(
-            SpinnerColumn(),
-            TextColumn("[progress.description]{task.description}"),
-            BarColumn(),
-            TextColumn("[progress.percentage]{task.percentage:>3.0f}%"),
-            TimeElapsedColumn(),
-            console=self.console
-        ) as progress:
-            task = progress.add_task("[cyan]Waiting for crawl to complete...", total=max_attempts)
-            
-            while attempts < max_attempts:
-                status = self.check_crawl_status(crawl_id)
-                
-                if status.get("status") == "completed":
-                    progress.update(task, completed=max_attempts)
-                    return status
-                
-                attempts += 1
-                progress.update(task, completed=attempts)
-                time.sleep(poll_interval)
-            
-            raise Exception(f"Crawl did not complete within {max_attempts * poll_interval} seconds")
-
-    def save_to_file(self, data: Any, directory: str, filename: str, format_type: str = "text") -> str:
-        """
-        Save data to a file in the specified directory with the given filename.
+        Requests are gated by an AutoScaledPool, which starts with a few concurrent
+        requests and ramps up to `concurrency` while the server keeps up. URLs are
+        dispatched round-robin across hosts so that the per-host politeness delay
+        of one site does not hold up the others.
         
         Args:
-            data: The data to save.
-            directory: The directory to save the file in.
-            filename: The name of the file.
-            format_type: The format of the data (markdown, html, text, json).
+            urls: The URLs to scrape.
+            params: Additional parameters applied to every scrape request.
+            concurrency: Maximum number of concurrent scrape requests.
+            pool: Optional pool to share between batches; overrides `concurrency`.
             
         Returns:
-            The full path to the saved file.
+            One result per URL, in input order. A failed scrape is returned as
+            {"error": ..., "url": ...} instead of aborting the whole batch.
         """
-        # Handle relative paths and ensure directory exists
-        if not os.path.isabs(directory):
-            # If not an absolute path, make it relative to the script's directory
-            script_dir = os.path.dirname(os.path.abspath(__file__))
-            directory = os.path.join(script_dir, directory)
-        
-        # Create directory if it doesn't exist
-        os.makedirs(directory, exist_ok=True)
+        if params is None:
+            params = {"formats": ["markdown"]}
+        if pool is None:
+            pool = AutoScaledPool(desired_concurrency=min(5, concurrency), max_concurrency=concurrency)
         
-        # Add appropriate extension if not provided
-        if not filename.endswith((".md", ".html", ".txt", ".json")):
-            if format_type == "markdown":
-                filename += ".md"
-            elif format_type == "html":
-                filename += ".html"
-            elif format_type == "json":
-                filename += ".json"
-            else:
-                filename += ".txt"
+        def throttled(response: httpx.Response) -> bool:
+            return response.status_code in RETRY_STATUS_CODES
         
-        # Create full path
-        full_path = os.path.join(directory, filename)
+        async def scrape_one(url: str) -> Dict[str, Any]:
+            try:
+                # Every attempt takes its own slot, so each 429/5xx counts against the
+                # pool and no slot is held while backing off
+                for attempt in range(MAX_RETRIES + 1):
+                    response = await pool.run(lambda: self._scrape_attempt(url, params), failed=throttled)
+                    if not throttled(response) or attempt == MAX_RETRIES:
+                        break
+                    await asyncio.sleep(_retry_delay(attempt, response.headers.get("Retry-After")))
+                
+                if response.status_code != 200:
+                    raise Exception(f"Scrape failed with status code {response.status_code}: {response.text}")
+                return _json_loads(response.content).get("data", {})
+            except Exception as e:
+                return {"error": str(e), "url": url}
         
-        # Check if file already exists and handle conflicts
-        if os.path.exists(full_path):
-            # Get file name and extension
-            base_name, extension = os.path.splitext(filename)
-            counter = 1
-            
-            # Generate a new filename with a counter
-            while os.path.exists(full_path):
-                new_filename = f"{base_name}_{counter}{extension}"
-                full_path = os.path.join(directory, new_filename)
-                counter += 1
-        
-        # Save data to file
-        with open(full_path, "w", encoding="utf-8") as f:
-            if format_type == "json" and isinstance(data, dict):
-                json.dump(data, f, indent=2, ensure_ascii=False)
-            else:
-                f.write(str(data))
+        order = _interleave_by_host(urls)
+        results = await asyncio.gather(*(scrape_one(urls[index]) for index in order))
         
-        return full_path
-
+        ordered_results: List[Dict[str, Any]] = [{}] * len(urls)
+        for index, result in zip(order, results):
+            ordered_results[index] = result
+        return ordered_results
 
 class FirecrawlExplorer:
     """A simple terminal UI for exploring Firecrawl functionality using Rich."""
     
     def __init__(self):
         """Initialize the Firecrawl Explorer."""
-        self.console = Console()
+        # Output is styled with explicit markup, so Rich's automatic highlighting is skipped
+        self.console = Console(highlight=False)
         self.api_url = DEFAULT_API_URL
         self.api_key = ""
-        self.client = FirecrawlClient(self.api_url, self.api_key if self.api_key else None)
+        # Descriptions are the only listing column that needs the metadata sidecars
+        self.show_descriptions = True
+        self.client = FirecrawlClient(self.api_url, self.api_key if self.api_key else None, self.console)
+        self._warm_up_connection()
         self.running = True
         
         # Set up default export directories
@@ -303,13 +1593,115 @@ class FirecrawlExplorer:
         self.exports_base_dir = os.path.join(script_dir, "exports")
         
         # Create exports directory structure if it doesn't exist
+        self._exports_set_up_for: Optional[str] = None
+        # Export directory path -> (directory mtime_ns, file count)
+        self._dir_count_cache: Dict[str, Tuple[int, int]] = {}
         self._setup_export_directories()
         
         # Default save directory is now the exports folder
         self.default_save_dir = self.exports_base_dir
+        
+        # Static screens are built once and reprinted on every menu redraw.
+        # The Markdown ones are built on first use so rich.markdown is only
+        # imported when a screen needs it.
+        self._header_panel = Panel.fit(
+            "[bold green]🔥 Firecrawl Explorer[/bold green]",
+            subtitle="A simple terminal UI for Firecrawl",
+            box=box.ROUNDED
+        )
+        self._menu_panel = self._build_menu_panel()
+        self._file_options_panel = self._build_options_panel(
+            [
+                ("v", "View file"),
+                ("o", "Open containing folder"),
+                ("d", "Delete file"),
+                ("s", "Search files"),
+                ("r", "Return to categories"),
+            ],
+            "File Management Options"
+        )
+        self._display_options_panel = self._build_options_panel([("v", "View file"), ("r", "Return")], "Options")
+        self._welcome_panel: Optional[Panel] = None
+        self._help_panel: Optional[Panel] = None
+    
+    def _warm_up_connection(self):
+        """Open a pooled connection to the API in the background while the user reads the menu."""
+        client = self.client
+        
+        def warm_up():
+            try:
+                client.session.head(f"{client.api_url}/health", timeout=2)
+            except Exception:
+                pass  # Best effort: the first real request connects as usual
+        
+        threading.Thread(target=warm_up, daemon=True).start()
+    
+    def _wait_for_enter(self):
+        """Wait for the user to press Enter before returning to the main menu."""
+        try:
+            self.console.input("\n[bold cyan]Press Enter to return to the main menu...[/bold cyan]")
+        except EOFError:
+            pass  # Handle potential EOFError when running in certain environments
+        except KeyboardInterrupt:
+            self.console.print()  # Ctrl+C here also just returns to the menu
+    
+    def _open_in_filemanager(self, path: str):
+        """
+        Open a file or folder with the desktop's default application.
+        
+        The opener is started directly rather than through a shell, so paths
+        containing quotes are safe and the menu does not wait for it to exit.
+        
+        Args:
+            path: The file or folder to open.
+        """
+        if sys.platform == "win32":
+            os.startfile(path)
+        elif sys.platform == "darwin":  # macOS
+            subprocess.Popen(["open", path], close_fds=True)
+        else:  # Linux
+            subprocess.Popen(
+                ["xdg-open", path],
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+                close_fds=True,
+                start_new_session=True
+            )
+    
+    def _build_options_panel(self, options: List[Tuple[str, str]], title: str) -> Panel:
+        """Build a panel listing (key, action) options."""
+        options_table = Table(show_header=False, box=box.SIMPLE)
+        options_table.add_column("Key", style="cyan")
+        options_table.add_column("Action", style="green")
+        
+        for key, action in options:
+            options_table.add_row(key, action)
+        
+        return Panel(options_table, title=title, box=box.ROUNDED)
+    
+    def _build_menu_panel(self) -> Panel:
+        """Build the main menu panel."""
+        menu_table = Table(show_header=False, box=box.SIMPLE)
+        menu_table.add_column("Key", style="cyan")
+        menu_table.add_column("Action", style="green")
+        
+        menu_table.add_row("1", "Scrape URL")
+        menu_table.add_row("2", "Crawl Website")
+        menu_table.add_row("3", "Map Website")
+        menu_table.add_row("4", "Settings")
+        menu_table.add_row("5", "Help")
+        menu_table.add_row("6", "Manage Exports")
+        menu_table.add_row("7", "Batch Scrape")
+        menu_table.add_row("q", "Quit")
+        
+        return Panel(menu_table, title="Main Menu", box=box.ROUNDED)
     
     def _setup_export_directories(self):
         """Set up the export directory structure."""
+        # Nothing to do unless the base directory changed since the last setup
+        if self.exports_base_dir == self._exports_set_up_for:
+            return
+        
         # Create main exports directory
         os.makedirs(self.exports_base_dir, exist_ok=True)
         
@@ -321,54 +1713,32 @@ class FirecrawlExplorer:
             "docs": os.path.join(self.exports_base_dir, "docs"),
             "custom": os.path.join(self.exports_base_dir, "custom")
         }
+        # Menu choices that only depend on the directories. Save location panels
+        # do too, so they are rebuilt on first use.
+        self._export_dir_names = list(self.export_dirs)
+        self._manage_export_choices = [str(i) for i in range(1, len(self.export_dirs) + 2)] + ["c"]
+        self._save_location_options: Dict[str, Tuple[Panel, List[Optional[str]], List[str]]] = {}
         
         # Create each subdirectory
         for directory in self.export_dirs.values():
             os.makedirs(directory, exist_ok=True)
+        
+        self._exports_set_up_for = self.exports_base_dir
     
     def display_header(self):
         """Display the application header."""
-        self.console.print(Panel.fit(
-            "[bold green]🔥 Firecrawl Explorer[/bold green]",
-            subtitle="A simple terminal UI for Firecrawl",
-            box=box.ROUNDED
-        ))
+        self.console.print(self._header_panel)
     
     def display_menu(self):
         """Display the main menu."""
-        menu_table = Table(show_header=False, box=box.SIMPLE)
-        menu_table.add_column("Key", style="cyan")
-        menu_table.add_column("Action", style="green")
-        
-        menu_table.add_row("1", "Scrape URL")
-        menu_table.add_row("2", "Crawl Website")
-        menu_table.add_row("3", "Map Website")
-        menu_table.add_row("4", "Settings")
-        menu_table.add_row("5", "Help")
-        menu_table.add_row("6", "Manage Exports")
-        menu_table.add_row("q", "Quit")
-        
-        self.console.print(Panel(menu_table, title="Main Menu", box=box.ROUNDED))
+        self.console.print(self._menu_panel)
     
     def display_welcome(self):
         """Display the welcome screen."""
-        welcome_text = """
-# Welcome to Firecrawl Explorer
-
-This application allows you to interact with your local Firecrawl instance and explore its capabilities.
-
-## Features:
-- 🔍 **Scrape URL**: Extract content from a single webpage
-- 🕸️ **Crawl Website**: Crawl an entire website and extract content from all pages
-- 🗺️ **Map Website**: Discover all links on a website
-
-## Getting Started:
-1. Use the menu to navigate between different features
-2. Configure your Firecrawl API URL in the Settings if needed
-3. Start exploring the capabilities of your Firecrawl instance!
-        """
-        
-        self.console.print(Panel(Markdown(welcome_text), box=box.ROUNDED))
+        if self._welcome_panel is None:
+            from rich.markdown import Markdown
+            self._welcome_panel = Panel(Markdown(WELCOME_TEXT), box=box.ROUNDED)
+        self.console.print(self._welcome_panel)
     
     def scrape_url(self):
         """Handle the scrape URL functionality."""
@@ -406,16 +1776,31 @@ This application allows you to interact with your local Firecrawl instance and e
             
             if format_value == "markdown":
                 content = result.get("markdown", "No markdown content returned")
-                self.console.print(Panel(Markdown(content), title=f"Scrape Results for {url}", box=box.ROUNDED))
             elif format_value == "html":
                 content = result.get("html", "No HTML content returned")
-                self.console.print(Panel(Syntax(content, "html", theme="monokai", line_numbers=True), title=f"Scrape Results for {url}", box=box.ROUNDED))
             elif format_value == "json":
-                content = json.dumps(result.get("json", {}), indent=2)
-                self.console.print(Panel(Syntax(content, "json", theme="monokai", line_numbers=True), title=f"Scrape Results for {url}", box=box.ROUNDED))
+                content = _json_dumpb(result.get("json", {}), indent=True).decode("utf-8")
             else:
                 content = result.get("text", "No text content returned")
-                self.console.print(Panel(content, title=f"Scrape Results for {url}", box=box.ROUNDED))
+            
+            # Only render the first lines; the full content is kept for saving.
+            # A bounded split avoids building a list of every line of a large page.
+            head = content.split("\n", SCRAPE_PREVIEW_LINES)
+            preview = "\n".join(head[:SCRAPE_PREVIEW_LINES])
+            rest = head[SCRAPE_PREVIEW_LINES] if len(head) > SCRAPE_PREVIEW_LINES else ""
+            hidden_lines = rest.count("\n") + (1 if rest and not rest.endswith("\n") else 0)
+            subtitle = f"... (truncated, {hidden_lines} more lines — save to see all)" if hidden_lines > 0 else None
+            
+            if format_value == "markdown":
+                from rich.markdown import Markdown
+                renderable = Markdown(preview)
+            elif format_value in ("html", "json"):
+                from rich.syntax import Syntax
+                renderable = Syntax(preview, format_value, theme="monokai", line_numbers=True)
+            else:
+                renderable = preview
+            
+            self.console.print(Panel(renderable, title=f"Scrape Results for {url}", subtitle=subtitle, box=box.ROUNDED))
             
             # Display metadata
             if "metadata" in result:
@@ -447,18 +1832,14 @@ This application allows you to interact with your local Firecrawl instance and e
         except Exception as e:
             self.console.print(f"[bold red]Error:[/bold red] {str(e)}")
         
-        # Improved user prompt
-        self.console.print("\n[bold cyan]Press Enter to return to the main menu...[/bold cyan]")
-        try:
-            input()
-        except EOFError:
-            pass  # Handle potential EOFError when running in certain environments
+        self._wait_for_enter()
     
     def crawl_url(self):
         """Handle the crawl URL functionality."""
         self.console.print(Panel.fit("[bold]🕸️ Crawl Website[/bold]", box=box.ROUNDED))
         
-        url = Prompt.ask("Enter the URL to crawl", default=DEFAULT_TEST_URL)
+        # URLs may contain commas but never unescaped whitespace, so several are space-separated
+        url_input = Prompt.ask("Enter the URL(s) to crawl (separate several with spaces)", default=DEFAULT_TEST_URL)
         exclude_paths = Prompt.ask("Exclude paths (comma-separated)", default="")
         include_paths = Prompt.ask("Include paths (comma-separated)", default="")
         depth = Prompt.ask("Maximum depth", default="2")
@@ -478,53 +1859,98 @@ This application allows you to interact with your local Firecrawl instance and e
             }
             
             if exclude_paths:
-                params["excludePaths"] = [path.strip() for path in exclude_paths.split(",")]
+                params["excludePaths"] = _parse_csv(exclude_paths)
             
             if include_paths:
-                params["includePaths"] = [path.strip() for path in include_paths.split(",")]
+                params["includePaths"] = _parse_csv(include_paths)
             
-            crawl_response = self.client.crawl_url(url, params)
-            crawl_id = crawl_response.get("id")
+            crawl_urls: Dict[str, str] = {}
+            for url in url_input.split():
+                # A failed start must not abandon the crawls already running
+                try:
+                    crawl_response = self.client.crawl_url(url, params)
+                except Exception as e:
+                    self.console.print(f"[bold red]Error starting crawl for {url}:[/bold red] {str(e)}")
+                    continue
+                crawl_id = crawl_response.get("id")
+                
+                if not crawl_id:
+                    self.console.print(f"[bold red]Error:[/bold red] No crawl ID returned for {url}")
+                    continue
+                
+                crawl_urls[crawl_id] = url
+                self.console.print(f"[cyan]Crawl initiated with ID: {crawl_id}[/cyan]")
             
-            if not crawl_id:
-                self.console.print("[bold red]Error:[/bold red] No crawl ID returned")
+            if not crawl_urls:
                 return
             
-            self.console.print(f"[cyan]Crawl initiated with ID: {crawl_id}[/cyan]")
             self.console.print("[cyan]Waiting for crawl to complete...[/cyan]")
             
-            # Wait for crawl completion
-            final_status = self.client.wait_for_crawl_completion(crawl_id)
-            
-            # Create a table to display the results
-            table = Table(title=f"Crawl Results for {url}", box=box.ROUNDED)
-            table.add_column("URL", style="cyan")
-            table.add_column("Status", style="green")
-            table.add_column("Content Length", style="yellow")
-            
-            data = final_status.get("data", [])
-            for item in data:
-                page_url = item.get("metadata", {}).get("sourceURL", "Unknown")
-                status = "Success"
-                content_length = len(item.get("markdown", "")) if "markdown" in item else 0
-                table.add_row(page_url, status, str(content_length))
-            
-            self.console.print(table)
+            # Wait for crawl completion, downloading at most a screenful of results
+            if len(crawl_urls) == 1:
+                crawl_id = next(iter(crawl_urls))
+                results = {crawl_id: self.client.wait_for_crawl_completion(crawl_id, max_items=CRAWL_DISPLAY_LIMIT)}
+            else:
+                results = self.client.wait_for_many(list(crawl_urls), max_items=CRAWL_DISPLAY_LIMIT)
             
-            # Ask if user wants to save the results
-            if Confirm.ask("Do you want to save the crawl results to a file?", default=True):
-                # Use the helper method to handle the save dialog
-                self._handle_save_dialog(final_status, url, "crawl_", "json")
+            for crawl_id, final_status in results.items():
+                if "error" in final_status:
+                    self.console.print(f"[bold red]Error crawling {crawl_urls[crawl_id]}:[/bold red] {final_status['error']}")
+                else:
+                    self._show_crawl_results(crawl_urls[crawl_id], crawl_id, final_status)
         
+        except KeyboardInterrupt:
+            # The crawls keep running on the server; only the wait is abandoned
+            self.client.cancel_wait()
+            self.console.print("\n[yellow]Stopped waiting for the crawl.[/yellow]")
         except Exception as e:
             self.console.print(f"[bold red]Error:[/bold red] {str(e)}")
         
-        # Improved user prompt
-        self.console.print("\n[bold cyan]Press Enter to return to the main menu...[/bold cyan]")
-        try:
-            input()
-        except EOFError:
-            pass  # Handle potential EOFError when running in certain environments
+        self._wait_for_enter()
+    
+    def _show_crawl_results(self, url: str, crawl_id: str, final_status: Dict[str, Any]):
+        """Display a finished crawl's results and offer to save them."""
+        # Create a table to display the results
+        # Fixed-width, non-wrapping columns keep Rich from re-measuring every row
+        table = Table(title=f"Crawl Results for {url}", box=box.ROUNDED, pad_edge=False, show_footer=True)
+        table.add_column("URL", style="cyan", no_wrap=True, overflow="ellipsis")
+        table.add_column("Status", style="green", no_wrap=True, width=7)
+        table.add_column("Content Length", style="yellow", no_wrap=True, width=14)
+        
+        # Rows and the total length are built in the same pass over the pages
+        data = final_status.get("data", [])
+        total_length = 0
+        for item in data:
+            page_url = item.get("metadata", {}).get("sourceURL", "Unknown")
+            status = "Success"
+            markdown = item.get("markdown")
+            content_length = len(markdown) if markdown else 0
+            total_length += content_length
+            table.add_row(page_url, status, str(content_length))
+        
+        table.columns[0].footer = f"{len(data)} pages"
+        table.columns[2].footer = str(total_length)
+        
+        self.console.print(table)
+        
+        # Larger results are only downloaded in full when saving
+        if final_status.get("next"):
+            self.console.print(
+                f"[yellow]Showing the first {len(data)} of {final_status.get('total', '?')} pages. "
+                "Saving will stream all pages to disk.[/yellow]"
+            )
+        
+        # Ask if user wants to save the results
+        if Confirm.ask("Do you want to save the crawl results to a file?", default=True):
+            if final_status.get("next"):
+                # Stream every page straight to the file instead of loading them all
+                self._handle_save_dialog(
+                    None, url, "crawl_", "json",
+                    writer=lambda directory, filename: self.client.save_crawl_stream(crawl_id, directory, filename)
+                )
+            else:
+                # Use the helper method to handle the save dialog
+                self._handle_save_dialog(final_status, url, "crawl_", "json")
     
     def map_url(self):
         """Handle the map URL functionality."""
@@ -549,21 +1975,37 @@ This application allows you to interact with your local Firecrawl instance and e
             
             result = self.client.map_url(url, params)
             
-            # Create a table to display the results
-            table = Table(title=f"Map Results for {url}", box=box.ROUNDED)
-            table.add_column("URL", style="cyan")
+            # Fragments, tracking parameters and trailing slashes often duplicate links
+            raw_links = result.get("links", [])
+            links, canonical_map = _dedupe_urls(raw_links)
             
-            links = result.get("links", [])
-            for link in links:
-                table.add_row(link)
+            if len(links) > MAP_DISPLAY_LIMIT:
+                # Rendering thousands of rows is slow and unreadable; save them instead
+                self.console.print(f"[yellow]{len(links)} links found, too many to display. Save them to a file to review them.[/yellow]")
+            else:
+                # Create a table to display the results
+                table = Table(title=f"Map Results for {url}", box=box.ROUNDED, pad_edge=False)
+                table.add_column("URL", style="cyan", no_wrap=True, overflow="ellipsis", width=max(self.console.width - 4, 10))
+                
+                for link in links:
+                    table.add_row(link)
+                
+                self.console.print(table)
             
-            self.console.print(table)
             self.console.print(f"[bold green]Total links found:[/bold green] {len(links)}")
+            if len(raw_links) > len(links):
+                self.console.print(f"[yellow]Removed {len(raw_links) - len(links)} duplicate links.[/yellow]")
             
             # Ask if user wants to save the results
             if Confirm.ask("Do you want to save the map results to a file?", default=True):
                 # Format links as a list for better readability
-                links_data = {"url": url, "links": links, "total": len(links)}
+                links_data = {
+                    "url": url,
+                    "links": links,
+                    "total": len(links),
+                    "duplicates_removed": len(raw_links) - len(links),
+                    "canonical_map": canonical_map
+                }
                 
                 # Use the helper method to handle the save dialog
                 self._handle_save_dialog(links_data, url, "map_", "json")
@@ -571,12 +2013,107 @@ This application allows you to interact with your local Firecrawl instance and e
         except Exception as e:
             self.console.print(f"[bold red]Error:[/bold red] {str(e)}")
         
-        # Improved user prompt
-        self.console.print("\n[bold cyan]Press Enter to return to the main menu...[/bold cyan]")
+        self._wait_for_enter()
+    
+    def batch_scrape(self):
+        """Handle the batch scrape functionality."""
+        self.console.print(Panel.fit("[bold]📚 Batch Scrape[/bold]", box=box.ROUNDED))
+        
+        source = Prompt.ask(
+            "URL source (map a website, a comma-separated list, or a file with one URL per line)",
+            choices=["map", "list", "file"],
+            default="map"
+        )
+        
         try:
-            input()
-        except EOFError:
-            pass  # Handle potential EOFError when running in certain environments
+            if source == "map":
+                label = Prompt.ask("Enter the URL to map", default=DEFAULT_TEST_URL)
+                search_term = Prompt.ask("Search term (optional)", default="")
+                include_subdomains = Confirm.ask("Include subdomains?", default=False)
+                limit = Prompt.ask("Maximum links to scrape", default="20")
+                
+                map_params = {
+                    "includeSubdomains": include_subdomains,
+                    "limit": int(limit)
+                }
+                
+                if search_term:
+                    map_params["search"] = search_term
+                
+                self.console.print("[cyan]Mapping URL...[/cyan]")
+                urls = self.client.map_url(label, map_params).get("links", [])
+            elif source == "list":
+                urls = _parse_csv(Prompt.ask("Enter the URLs to scrape (comma-separated)"))
+                label = urls[0] if urls else ""
+            else:
+                path = Prompt.ask("Path to the URL file")
+                with open(path, "r", encoding="utf-8") as f:
+                    urls = [line.strip() for line in f if line.strip() and not line.lstrip().startswith("#")]
+                label = urls[0] if urls else path
+            
+            # Scrape each page only once, however many variants of its link were given
+            links, _ = _dedupe_urls([link for link in urls if link])
+            
+            if not links:
+                self.console.print("[yellow]No links found to scrape.[/yellow]")
+            else:
+                concurrency = Prompt.ask("Maximum concurrent requests", default="10")
+                crawl_delay = Prompt.ask("Delay between requests to the same host (seconds)", default="0.5")
+                only_main_content = Confirm.ask("Extract only main content?", default=True)
+                
+                scrape_params = {
+                    "formats": ["markdown"],
+                    "onlyMainContent": only_main_content
+                }
+                
+                with self.console.status(f"[cyan]Scraping {len(links)} URLs...[/cyan]"):
+                    results = asyncio.run(
+                        self._scrape_urls(links, scrape_params, int(concurrency), float(crawl_delay))
+                    )
+                
+                # Create a table to display the results
+                table = Table(title=f"Batch Scrape Results ({len(links)} URLs)", box=box.ROUNDED)
+                table.add_column("URL", style="cyan", no_wrap=True, overflow="ellipsis")
+                table.add_column("Status", style="green")
+                table.add_column("Content Length", style="yellow")
+                
+                failed = 0
+                for link, result in zip(links, results):
+                    if "error" in result:
+                        failed += 1
+                        table.add_row(link, f"[red]Error: {result['error']}[/red]", "0")
+                    else:
+                        table.add_row(link, "Success", str(len(result.get("markdown", ""))))
+                
+                self.console.print(table)
+                self.console.print(f"[bold green]Scraped:[/bold green] {len(links) - failed}  [bold red]Failed:[/bold red] {failed}")
+                
+                # Ask if user wants to save the results
+                if Confirm.ask("Do you want to save the batch scrape results to a file?", default=True):
+                    batch_data = {"source": source, "url": label, "total": len(links), "failed": failed, "data": results}
+                    
+                    # Use the helper method to handle the save dialog
+                    self._handle_save_dialog(batch_data, label, "batch_", "json")
+        
+        except Exception as e:
+            self.console.print(f"[bold red]Error:[/bold red] {str(e)}")
+        
+        self._wait_for_enter()
+    
+    async def _scrape_urls(
+        self,
+        urls: List[str],
+        params: Dict[str, Any],
+        concurrency: int,
+        crawl_delay: float
+    ) -> List[Dict[str, Any]]:
+        """Scrape a list of URLs concurrently with a short-lived async client."""
+        async with AsyncFirecrawlClient(
+            self.api_url,
+            self.api_key if self.api_key else None,
+            crawl_delay_per_host=crawl_delay
+        ) as client:
+            return await client.scrape_urls(urls, params, concurrency)
     
     def settings(self):
         """Handle the settings functionality."""
@@ -588,6 +2125,7 @@ This application allows you to interact with your local Firecrawl instance and e
         current_settings.add_row("API URL", self.api_url)
         current_settings.add_row("API Key", "*****" if self.api_key else "Not set")
         current_settings.add_row("Default Exports Directory", self.exports_base_dir)
+        current_settings.add_row("Show Export Descriptions", "Yes" if self.show_descriptions else "No")
         
         # Add export subdirectories to the settings table
         for name, path in self.export_dirs.items():
@@ -602,62 +2140,41 @@ This application allows you to interact with your local Firecrawl instance and e
             # Update exports base directory
             new_exports_base = Prompt.ask("Default Exports Directory", default=self.exports_base_dir)
             
+            # Hiding descriptions lets export listings skip reading metadata files
+            new_show_descriptions = Confirm.ask("Show export descriptions when browsing?", default=self.show_descriptions)
+            
             # Apply changes
             self.api_url = new_api_url
             self.api_key = new_api_key
+            self.show_descriptions = new_show_descriptions
             
             # Update exports directory if changed
             if new_exports_base != self.exports_base_dir:
                 self.exports_base_dir = new_exports_base
                 self.default_save_dir = self.exports_base_dir
                 
-                # Re-setup export directories with the new base
-                self._setup_export_directories()
-            
-            self.client = FirecrawlClient(self.api_url, self.api_key if self.api_key else None)
-            
-            # Create the export directories if they don't exist
-            try:
-                self._setup_export_directories()
-                self.console.print("[bold green]Settings saved successfully![/bold green]")
-            except Exception as e:
-                self.console.print(f"[bold red]Error creating export directories:[/bold red] {str(e)}")
-        
-        # Improved user prompt
-        self.console.print("\n[bold cyan]Press Enter to return to the main menu...[/bold cyan]")
-        try:
-            input()
-        except EOFError:
-            pass  # Handle potential EOFError when running in certain environments
-    
-    def help(self):
-        """Display help information."""
-        help_text = """
-## Keyboard Shortcuts:
-- `1`: Go to Scrape URL
-- `2`: Go to Crawl Website
-- `3`: Go to Map Website
-- `4`: Go to Settings
-- `5`: Show this help
-- `6`: Manage Exports
-- `q`: Quit the application
-
-## About Firecrawl:
-Firecrawl is an API service that takes a URL, crawls it, and converts it into clean markdown or structured data. It crawls all accessible subpages and gives you clean data for each.
-
-## Self-hosted Instance:
-You are currently using a self-hosted instance of Firecrawl. This means that all data processing happens locally on your machine.
-
-## Export System:
-The export system organizes your data into different categories:
-- **Scrapes**: Single page scraping results
-- **Crawls**: Multi-page crawling results
-- **Maps**: Website mapping results
-- **Docs**: Documentation and guides
-- **Custom**: Any other exports
-        """
+                # Re-setup export directories with the new base
+                self._setup_export_directories()
+            
+            self.client.close()
+            self.client = FirecrawlClient(self.api_url, self.api_key if self.api_key else None, self.console)
+            self._warm_up_connection()
+            
+            # Create the export directories if they don't exist
+            try:
+                self._setup_export_directories()
+                self.console.print("[bold green]Settings saved successfully![/bold green]")
+            except Exception as e:
+                self.console.print(f"[bold red]Error creating export directories:[/bold red] {str(e)}")
         
-        self.console.print(Panel(Markdown(help_text), title="Help", box=box.ROUNDED))
+        self._wait_for_enter()
+    
+    def help(self):
+        """Display help information."""
+        if self._help_panel is None:
+            from rich.markdown import Markdown
+            self._help_panel = Panel(Markdown(HELP_TEXT), title="Help", box=box.ROUNDED)
+        self.console.print(self._help_panel)
         
         # Add option to save documentation
         if Confirm.ask("Would you like to save this documentation to the docs folder?", default=False):
@@ -689,6 +2206,13 @@ Discover all links on a website. Options include:
 - Searching for specific terms
 - Limiting the number of results
 
+### Batch Scrape
+Scrape many URLs concurrently, taken from a website map, a comma-separated list or a text file:
+- Configurable number of concurrent requests
+- Configurable politeness delay between requests to the same host
+- Failed pages are reported without aborting the batch
+- Results are saved together as a single JSON export
+
 ### Export System
 All results can be saved to the exports directory, organized by type:
 - **{self.export_dirs["scrapes"]}**: Single page scraping results
@@ -717,13 +2241,14 @@ Configure your Firecrawl instance in the Settings menu:
 - `4`: Go to Settings
 - `5`: Show this help
 - `6`: Manage Exports
+- `7`: Batch Scrape
 - `q`: Quit the application
 
 ## Generated on {datetime.now().strftime("%Y-%m-%d %H:%M:%S")}
 """
             
             # Save the documentation
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            timestamp = time.strftime("%Y%m%d_%H%M%S")
             filename = f"firecrawl_explorer_docs_{timestamp}"
             
             try:
@@ -739,24 +2264,13 @@ Configure your Firecrawl instance in the Settings menu:
                 # Offer to open the documentation
                 if Confirm.ask("Would you like to open the documentation?", default=True):
                     try:
-                        # Use the appropriate command based on the OS
-                        if sys.platform == "win32":
-                            os.startfile(saved_path)
-                        elif sys.platform == "darwin":  # macOS
-                            os.system(f"open '{saved_path}'")
-                        else:  # Linux
-                            os.system(f"xdg-open '{saved_path}'")
+                        self._open_in_filemanager(saved_path)
                     except Exception as e:
                         self.console.print(f"[yellow]Could not open documentation: {str(e)}[/yellow]")
             except Exception as e:
                 self.console.print(f"[bold red]Error saving documentation:[/bold red] {str(e)}")
         
-        # Improved user prompt
-        self.console.print("\n[bold cyan]Press Enter to return to the main menu...[/bold cyan]")
-        try:
-            input()
-        except EOFError:
-            pass  # Handle potential EOFError when running in certain environments
+        self._wait_for_enter()
     
     def manage_exports(self):
         """Browse and manage saved exports."""
@@ -769,14 +2283,7 @@ Configure your Firecrawl instance in the Settings menu:
         categories_table.add_column("Count", style="yellow")
         
         # Count files in each export directory
-        file_counts = {}
-        for name, path in self.export_dirs.items():
-            try:
-                # Count only files, not directories
-                count = len([f for f in os.listdir(path) if os.path.isfile(os.path.join(path, f))])
-                file_counts[name] = count
-            except FileNotFoundError:
-                file_counts[name] = 0
+        file_counts = {name: self._count_export_files(path) for name, path in self.export_dirs.items()}
         
         # Add all categories to the table
         for i, (name, path) in enumerate(self.export_dirs.items(), 1):
@@ -786,264 +2293,424 @@ Configure your Firecrawl instance in the Settings menu:
         total_files = sum(file_counts.values())
         categories_table.add_row(str(len(self.export_dirs) + 1), "All Exports", str(total_files))
         
+        # Add option to clear cached scrape/map responses
+        categories_table.add_row("c", "Clear Cache", str(self.client.cache_size()))
+        
         self.console.print(Panel(categories_table, title="Export Categories", box=box.ROUNDED))
         
         # Get user choice
-        choices = [str(i) for i in range(1, len(self.export_dirs) + 2)]
-        category_choice = Prompt.ask("Select a category to browse", choices=choices, default="1")
+        category_choice = Prompt.ask("Select a category to browse", choices=self._manage_export_choices, default="1")
         
         # Determine which directory to browse
-        if category_choice == str(len(self.export_dirs) + 1):
+        if category_choice == "c":
+            cleared = self.client.clear_cache()
+            self.console.print(f"[bold green]Cleared {cleared} cached responses.[/bold green]")
+        elif category_choice == str(len(self.export_dirs) + 1):
             # Browse all exports
             self._browse_exports("All Exports", None)
         else:
             # Browse specific category
             category_index = int(category_choice) - 1
-            category_name = list(self.export_dirs.keys())[category_index]
+            category_name = self._export_dir_names[category_index]
             category_path = self.export_dirs[category_name]
             self._browse_exports(category_name.capitalize(), category_path)
         
-        # Improved user prompt
-        self.console.print("\n[bold cyan]Press Enter to return to the main menu...[/bold cyan]")
-        try:
-            input()
-        except EOFError:
-            pass  # Handle potential EOFError when running in certain environments
+        self._wait_for_enter()
     
-    def _browse_exports(self, category_name: str, category_path: Optional[str]):
+    def _count_export_files(self, path: str) -> int:
         """
-        Browse exports in a specific category or all exports.
+        Count the files (not directories) in an export directory.
+        
+        A directory's mtime changes whenever an entry is added or removed, so a
+        count is reused until then and a repeat visit costs a single stat call.
         
         Args:
-            category_name: The name of the category to browse.
-            category_path: The path to the category directory, or None for all exports.
+            path: The export directory.
+            
+        Returns:
+            The number of files, or 0 if the directory does not exist.
+        """
+        try:
+            mtime_ns = os.stat(path).st_mtime_ns
+        except FileNotFoundError:
+            return 0
+        
+        cached = self._dir_count_cache.get(path)
+        if cached and cached[0] == mtime_ns:
+            return cached[1]
+        
+        with os.scandir(path) as entries:
+            count = sum(1 for entry in entries if entry.is_file())
+        self._dir_count_cache[path] = (mtime_ns, count)
+        return count
+    
+    def _scan_export_dir(self, path: str, category: str) -> List[Dict[str, Any]]:
         """
-        self.console.print(Panel.fit(f"[bold]📁 Browsing {category_name}[/bold]", box=box.ROUNDED))
+        List the exports in a directory, with their metadata if available.
+        
+        A single scandir pass provides each file's type, size and modification
+        time from the directory read instead of separate stat calls per file, and
+        records which metadata sidecars exist so none has to be probed for.
+        Sidecars are not read here; see _ensure_metadata.
         
-        # Collect all files
+        Args:
+            path: The export directory.
+            category: The category name recorded for each file.
+            
+        Returns:
+            File info dictionaries (name, path, category, size, modified as
+            integer nanoseconds and, if the file has a sidecar, meta_path and
+            meta_mtime_ns). Empty if the directory does not exist.
+        """
         files = []
+        # Sidecar name -> (path, mtime_ns)
+        sidecars: Dict[str, Tuple[str, int]] = {}
+        try:
+            with os.scandir(path) as entries:
+                for entry in entries:
+                    if entry.name.endswith(".meta.json"):
+                        sidecars[entry.name] = (entry.path, entry.stat().st_mtime_ns)
+                        continue
+                    if not entry.is_file():
+                        continue
+                    
+                    stat = entry.stat()
+                    files.append({
+                        "name": entry.name,
+                        "path": entry.path,
+                        "category": category,
+                        "size": stat.st_size,
+                        "modified": stat.st_mtime_ns
+                    })
+        except FileNotFoundError:
+            return files
+        
+        # Point each file at its sidecar found in the same pass
+        for file_info in files:
+            sidecar = sidecars.get(_sidecar_name(file_info["name"]))
+            if sidecar is not None:
+                file_info["meta_path"], file_info["meta_mtime_ns"] = sidecar
+        
+        return files
+    
+    def _ensure_metadata(self, file_info: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """
+        Load a file's metadata sidecar on first use and keep it on file_info.
+        
+        Only files that are displayed, searched or viewed pay for reading their
+        sidecar; unchanged sidecars are served from cache on repeat browsing.
+        
+        Args:
+            file_info: A file info dictionary from _scan_export_dir.
+            
+        Returns:
+            The file's metadata, or None if it has none or it cannot be read.
+        """
+        meta_path = file_info.pop("meta_path", None)
+        if meta_path is not None:
+            mtime_ns = file_info.pop("meta_mtime_ns")
+            try:
+                file_info["metadata"] = _load_export_metadata(meta_path, mtime_ns)
+            except Exception:
+                pass
+        
+        return file_info.get("metadata")
+    
+    def _attach_cached_metadata(self, files: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Attach metadata that is already cached and return the files whose sidecars are cold.
+        
+        Args:
+            files: File info dictionaries; those already loaded are skipped.
+            
+        Returns:
+            The files whose sidecars still have to be read from disk.
+        """
+        cold = []
+        for file_info in files:
+            if "meta_path" not in file_info:
+                continue
+            if _cached_export_metadata(file_info["meta_path"], file_info["meta_mtime_ns"]) is not None:
+                self._ensure_metadata(file_info)
+            else:
+                cold.append(file_info)
+        
+        return cold
+    
+    def _iter_exports(self, dirs: List[Tuple[str, str]]) -> Iterator[Dict[str, Any]]:
+        """
+        Yield the exports in several directories.
+        
+        Args:
+            dirs: (category, path) pairs; each directory is scanned once.
+            
+        Yields:
+            File info dictionaries from _scan_export_dir.
+        """
+        for category, path in dirs:
+            yield from self._scan_export_dir(path, category)
+    
+    def _collect_files(self, category_name: str, category_path: Optional[str]) -> List[Dict[str, Any]]:
+        """
+        Collect the exports in a category, or in all categories, newest first.
+        
+        Args:
+            category_name: The name of the category.
+            category_path: The path to the category directory, or None for all exports.
+            
+        Returns:
+            File info dictionaries from _scan_export_dir.
+        """
         if category_path is None:
             # Collect files from all export directories
-            for name, path in self.export_dirs.items():
-                try:
-                    for filename in os.listdir(path):
-                        file_path = os.path.join(path, filename)
-                        if os.path.isfile(file_path) and not filename.endswith(".meta.json"):
-                            # Get file info
-                            file_info = {
-                                "name": filename,
-                                "path": file_path,
-                                "category": name,
-                                "size": os.path.getsize(file_path),
-                                "modified": os.path.getmtime(file_path)
-                            }
-                            
-                            # Try to get metadata if available
-                            meta_path = f"{os.path.splitext(file_path)[0]}.meta.json"
-                            if os.path.exists(meta_path):
-                                try:
-                                    with open(meta_path, "r", encoding="utf-8") as f:
-                                        metadata = json.load(f)
-                                        file_info["metadata"] = metadata
-                                except Exception:
-                                    pass
-                            
-                            files.append(file_info)
-                except FileNotFoundError:
-                    continue
+            dirs = list(self.export_dirs.items())
         else:
             # Collect files from the specific category
-            try:
-                for filename in os.listdir(category_path):
-                    file_path = os.path.join(category_path, filename)
-                    if os.path.isfile(file_path) and not filename.endswith(".meta.json"):
-                        # Get file info
-                        file_info = {
-                            "name": filename,
-                            "path": file_path,
-                            "category": category_name.lower(),
-                            "size": os.path.getsize(file_path),
-                            "modified": os.path.getmtime(file_path)
-                        }
-                        
-                        # Try to get metadata if available
-                        meta_path = f"{os.path.splitext(file_path)[0]}.meta.json"
-                        if os.path.exists(meta_path):
-                            try:
-                                with open(meta_path, "r", encoding="utf-8") as f:
-                                    metadata = json.load(f)
-                                    file_info["metadata"] = metadata
-                            except Exception:
-                                pass
-                        
-                        files.append(file_info)
-            except FileNotFoundError:
-                pass
+            dirs = [(category_name.lower(), category_path)]
+        files = list(self._iter_exports(dirs))
         
         # Sort files by modification time (newest first)
-        files.sort(key=lambda x: x["modified"], reverse=True)
-        
-        if not files:
-            self.console.print("[yellow]No exports found in this category.[/yellow]")
-            return
-        
-        # Create a table to display the files
+        files.sort(key=itemgetter("modified"), reverse=True)
+        return files
+    
+    def _make_files_table(self) -> Table:
+        """Create an empty table with the columns of a file listing."""
         files_table = Table(box=box.ROUNDED)
         files_table.add_column("#", style="cyan")
         files_table.add_column("Filename", style="green")
         files_table.add_column("Category", style="blue")
         files_table.add_column("Size", style="yellow")
         files_table.add_column("Date", style="magenta")
-        files_table.add_column("Description", style="white")
+        if self.show_descriptions:
+            files_table.add_column("Description", style="white")
+        return files_table
+    
+    def _render_files_table(self, files: List[Dict[str, Any]], title: str, options_panel: Panel):
+        """
+        Print a titled table of up to 20 files followed by the screen's options.
+        
+        The whole screen is printed as one group, so it is measured and written
+        to the terminal in a single pass.
+        
+        Args:
+            files: List of file info dictionaries.
+            title: Title for the file list.
+            options_panel: The options panel shown below the table.
+        """
+        renderables = [Panel.fit(f"[bold]📁 {title}[/bold]", box=box.ROUNDED)]
+        
+        files_table = self._make_files_table()
+        if self.show_descriptions:
+            self._prefetch_metadata(files[:20])
         
         # Add files to the table
         for i, file_info in enumerate(files[:20], 1):  # Limit to 20 files for readability
-            # Format size
-            size_kb = file_info["size"] / 1024
-            size_str = f"{size_kb:.1f} KB"
-            
-            # Format date
-            date_str = datetime.fromtimestamp(file_info["modified"]).strftime("%Y-%m-%d %H:%M")
-            
-            # Get description if available
-            description = ""
-            if "metadata" in file_info and "description" in file_info["metadata"]:
-                description = file_info["metadata"]["description"]
-                if len(description) > 30:
-                    description = description[:27] + "..."
+            # Format size and date once per file, as the listing is redrawn after every action
+            if "size_str" not in file_info:
+                file_info["size_str"] = f"{file_info['size'] / 1024:.1f} KB"
+                file_info["date_str"] = time.strftime("%Y-%m-%d %H:%M", time.localtime(file_info["modified"] // 1_000_000_000))
             
-            files_table.add_row(
+            row = [
                 str(i),
                 file_info["name"],
                 file_info["category"].capitalize(),
-                size_str,
-                date_str,
-                description
-            )
+                file_info["size_str"],
+                file_info["date_str"]
+            ]
+            
+            # Get description if shown, reading metadata only for listed files
+            if self.show_descriptions:
+                description = ""
+                metadata = self._ensure_metadata(file_info)
+                if metadata and "description" in metadata:
+                    description = metadata["description"]
+                    if len(description) > 30:
+                        description = description[:27] + "..."
+                row.append(description)
+            
+            files_table.add_row(*row)
         
-        self.console.print(files_table)
+        renderables.append(files_table)
         
         if len(files) > 20:
-            self.console.print(f"[yellow]Showing 20 of {len(files)} files. Use search to find specific files.[/yellow]")
+            renderables.append(f"[yellow]Showing 20 of {len(files)} files. Use search to find specific files.[/yellow]")
         
-        # Options for file management
-        options_table = Table(show_header=False, box=box.SIMPLE)
-        options_table.add_column("Key", style="cyan")
-        options_table.add_column("Action", style="green")
+        renderables.append(options_panel)
+        self.console.print(Group(*renderables))
+    
+    def _ask_file_index(self, files: List[Dict[str, Any]], action: str) -> Optional[int]:
+        """
+        Prompt for a file number and return its index into files.
+        
+        Args:
+            files: List of file info dictionaries.
+            action: The action named in the prompt, e.g. "view".
+            
+        Returns:
+            The zero-based index, or None if the input was not a valid file number.
+        """
+        file_num = Prompt.ask(f"Enter file number to {action}", default="1")
+        try:
+            file_index = int(file_num) - 1
+        except ValueError:
+            self.console.print("[yellow]Invalid input. Please enter a number.[/yellow]")
+            return None
         
-        options_table.add_row("v", "View file")
-        options_table.add_row("o", "Open containing folder")
-        options_table.add_row("d", "Delete file")
-        options_table.add_row("s", "Search files")
-        options_table.add_row("r", "Return to categories")
+        if not 0 <= file_index < len(files):
+            self.console.print("[yellow]Invalid file number.[/yellow]")
+            return None
         
-        self.console.print(Panel(options_table, title="File Management Options", box=box.ROUNDED))
+        return file_index
+    
+    def _prefetch_metadata(self, files: List[Dict[str, Any]]):
+        """
+        Load the metadata sidecars of several files in parallel.
         
-        # Get user choice
-        action_choice = Prompt.ask("Select an action", choices=["v", "o", "d", "s", "r"], default="r")
+        Cached sidecars are attached directly. Cold sidecar reads are many small,
+        I/O-bound round trips, so they are spread over a bounded thread pool
+        instead of being read one by one; no pool is started when at most one
+        is cold.
         
-        if action_choice == "r":
+        Args:
+            files: File info dictionaries; those already loaded are skipped.
+        """
+        cold = self._attach_cached_metadata(files)
+        if len(cold) < 2:
+            for file_info in cold:
+                self._ensure_metadata(file_info)
             return
-        elif action_choice == "s":
-            # Search functionality
-            search_term = Prompt.ask("Enter search term")
-            search_results = []
-            
-            for file_info in files:
-                # Search in filename
-                if search_term.lower() in file_info["name"].lower():
+        
+        with ThreadPoolExecutor(max_workers=min(32, len(cold))) as executor:
+            list(executor.map(self._ensure_metadata, cold))
+    
+    def _search_files(self, files: List[Dict[str, Any]], search_term: str) -> List[Dict[str, Any]]:
+        """
+        Find files whose name or metadata (description, tags, source URL) contains a term.
+        
+        Args:
+            files: List of file info dictionaries.
+            search_term: The case-insensitive term to search for.
+            
+        Returns:
+            The matching file info dictionaries.
+        """
+        search_results = []
+        needle = _json_search_needle(search_term)
+        # Cached sidecars are used as they are; only cold ones are read from disk
+        cold = self._attach_cached_metadata(files)
+        
+        misses = set()
+        if needle is None:
+            self._prefetch_metadata(cold)
+        elif cold:
+            # Cold sidecars whose raw bytes cannot contain the term are never parsed
+            with ThreadPoolExecutor(max_workers=min(32, len(cold))) as executor:
+                found = list(executor.map(lambda f: _file_contains(f["meta_path"], needle), cold))
+            misses = {id(file_info) for file_info, hit in zip(cold, found) if not hit}
+        
+        for file_info in files:
+            # Search in filename
+            if search_term.lower() in file_info["name"].lower():
+                search_results.append(file_info)
+                continue
+            
+            if id(file_info) in misses:
+                continue
+            
+            # Search in metadata
+            metadata = self._ensure_metadata(file_info)
+            if metadata:
+                
+                # Search in description
+                if "description" in metadata and search_term.lower() in metadata["description"].lower():
                     search_results.append(file_info)
                     continue
                 
-                # Search in metadata
-                if "metadata" in file_info:
-                    metadata = file_info["metadata"]
-                    
-                    # Search in description
-                    if "description" in metadata and search_term.lower() in metadata["description"].lower():
-                        search_results.append(file_info)
-                        continue
-                    
-                    # Search in tags
-                    if "tags" in metadata and any(search_term.lower() in tag.lower() for tag in metadata["tags"]):
-                        search_results.append(file_info)
-                        continue
-                    
-                    # Search in source URL
-                    if "source_url" in metadata and search_term.lower() in metadata["source_url"].lower():
-                        search_results.append(file_info)
-                        continue
+                # Search in tags
+                if "tags" in metadata and any(search_term.lower() in tag.lower() for tag in metadata["tags"]):
+                    search_results.append(file_info)
+                    continue
+                
+                # Search in source URL
+                if "source_url" in metadata and search_term.lower() in metadata["source_url"].lower():
+                    search_results.append(file_info)
+                    continue
+        
+        return search_results
+    
+    def _browse_exports(self, category_name: str, category_path: Optional[str]):
+        """
+        Browse exports in a specific category or all exports.
+        
+        The directory is scanned once; the listing is kept across actions and
+        deletions are applied to it in memory.
+        
+        Args:
+            category_name: The name of the category to browse.
+            category_path: The path to the category directory, or None for all exports.
+        """
+        files = self._collect_files(category_name, category_path)
+        
+        while True:
+            if not files:
+                self.console.print("[yellow]No exports found in this category.[/yellow]")
+                return
             
-            if search_results:
-                self.console.print(f"[green]Found {len(search_results)} matching files.[/green]")
-                # Recursively call with search results
-                self._display_and_manage_files(search_results, f"Search Results for '{search_term}'")
-            else:
-                self.console.print("[yellow]No matching files found.[/yellow]")
-                # Return to file browsing
-                self._browse_exports(category_name, category_path)
-        elif action_choice == "v":
-            # View file
-            file_num = Prompt.ask("Enter file number to view", default="1")
-            try:
-                file_index = int(file_num) - 1
-                if 0 <= file_index < len(files):
-                    self._view_file(files[file_index])
+            self._render_files_table(files, f"Browsing {category_name}", self._file_options_panel)
+            
+            # Get user choice
+            action_choice = Prompt.ask("Select an action", choices=["v", "o", "d", "s", "r"], default="r")
+            
+            if action_choice == "r":
+                return
+            elif action_choice == "s":
+                # Search functionality
+                search_term = Prompt.ask("Enter search term")
+                search_results = self._search_files(files, search_term)
+                
+                if search_results:
+                    self.console.print(f"[green]Found {len(search_results)} matching files.[/green]")
+                    self._display_and_manage_files(search_results, f"Search Results for '{search_term}'")
                 else:
-                    self.console.print("[yellow]Invalid file number.[/yellow]")
-            except ValueError:
-                self.console.print("[yellow]Invalid input. Please enter a number.[/yellow]")
-            
-            # Return to file browsing
-            self._browse_exports(category_name, category_path)
-        elif action_choice == "o":
-            # Open containing folder
-            try:
-                folder_path = category_path if category_path else self.exports_base_dir
+                    self.console.print("[yellow]No matching files found.[/yellow]")
+            elif action_choice == "v":
+                # View file
+                file_index = self._ask_file_index(files, "view")
+                if file_index is not None:
+                    self._view_file(files[file_index])
+            elif action_choice == "o":
+                # Open containing folder
+                try:
+                    folder_path = category_path if category_path else self.exports_base_dir
+                    
+                    self._open_in_filemanager(folder_path)
+                    
+                    self.console.print(f"[green]Opened folder: {folder_path}[/green]")
+                except Exception as e:
+                    self.console.print(f"[yellow]Could not open folder: {str(e)}[/yellow]")
+            elif action_choice == "d":
+                # Delete file
+                file_index = self._ask_file_index(files, "delete")
+                if file_index is None:
+                    continue
                 
-                # Use the appropriate command based on the OS
-                if sys.platform == "win32":
-                    os.startfile(folder_path)
-                elif sys.platform == "darwin":  # macOS
-                    os.system(f"open '{folder_path}'")
-                else:  # Linux
-                    os.system(f"xdg-open '{folder_path}'")
+                file_info = files[file_index]
+                file_path = file_info["path"]
                 
-                self.console.print(f"[green]Opened folder: {folder_path}[/green]")
-            except Exception as e:
-                self.console.print(f"[yellow]Could not open folder: {str(e)}[/yellow]")
-            
-            # Return to file browsing
-            self._browse_exports(category_name, category_path)
-        elif action_choice == "d":
-            # Delete file
-            file_num = Prompt.ask("Enter file number to delete", default="1")
-            try:
-                file_index = int(file_num) - 1
-                if 0 <= file_index < len(files):
-                    file_info = files[file_index]
-                    file_path = file_info["path"]
-                    
-                    if Confirm.ask(f"Are you sure you want to delete '{file_info['name']}'?", default=False):
-                        try:
-                            # Delete the file
-                            os.remove(file_path)
-                            
-                            # Delete metadata file if it exists
-                            meta_path = f"{os.path.splitext(file_path)[0]}.meta.json"
-                            if os.path.exists(meta_path):
-                                os.remove(meta_path)
-                            
-                            self.console.print(f"[green]File deleted: {file_info['name']}[/green]")
-                        except Exception as e:
-                            self.console.print(f"[yellow]Could not delete file: {str(e)}[/yellow]")
-                else:
-                    self.console.print("[yellow]Invalid file number.[/yellow]")
-            except ValueError:
-                self.console.print("[yellow]Invalid input. Please enter a number.[/yellow]")
-            
-            # Return to file browsing
-            self._browse_exports(category_name, category_path)
+                if Confirm.ask(f"Are you sure you want to delete '{file_info['name']}'?", default=False):
+                    try:
+                        # Delete the file
+                        os.remove(file_path)
+                        files.pop(file_index)
+                        
+                        # Delete metadata file if it exists
+                        meta_path = f"{os.path.splitext(file_path)[0]}.meta.json"
+                        if os.path.exists(meta_path):
+                            os.remove(meta_path)
+                        
+                        self.console.print(f"[green]File deleted: {file_info['name']}[/green]")
+                    except Exception as e:
+                        self.console.print(f"[yellow]Could not delete file: {str(e)}[/yellow]")
     
     def _display_and_manage_files(self, files, title):
         """
@@ -1053,71 +2720,19 @@ Configure your Firecrawl instance in the Settings menu:
             files: List of file info dictionaries.
             title: Title for the file list.
         """
-        self.console.print(Panel.fit(f"[bold]📁 {title}[/bold]", box=box.ROUNDED))
-        
-        # Create a table to display the files
-        files_table = Table(box=box.ROUNDED)
-        files_table.add_column("#", style="cyan")
-        files_table.add_column("Filename", style="green")
-        files_table.add_column("Category", style="blue")
-        files_table.add_column("Size", style="yellow")
-        files_table.add_column("Date", style="magenta")
-        files_table.add_column("Description", style="white")
-        
-        # Add files to the table
-        for i, file_info in enumerate(files[:20], 1):  # Limit to 20 files for readability
-            # Format size
-            size_kb = file_info["size"] / 1024
-            size_str = f"{size_kb:.1f} KB"
+        while True:
+            self._render_files_table(files, title, self._display_options_panel)
             
-            # Format date
-            date_str = datetime.fromtimestamp(file_info["modified"]).strftime("%Y-%m-%d %H:%M")
+            # Get user choice
+            action_choice = Prompt.ask("Select an action", choices=["v", "r"], default="r")
             
-            # Get description if available
-            description = ""
-            if "metadata" in file_info and "description" in file_info["metadata"]:
-                description = file_info["metadata"]["description"]
-                if len(description) > 30:
-                    description = description[:27] + "..."
+            if action_choice != "v":
+                return
             
-            files_table.add_row(
-                str(i),
-                file_info["name"],
-                file_info["category"].capitalize(),
-                size_str,
-                date_str,
-                description
-            )
-        
-        self.console.print(files_table)
-        
-        # Options for file management
-        options_table = Table(show_header=False, box=box.SIMPLE)
-        options_table.add_column("Key", style="cyan")
-        options_table.add_column("Action", style="green")
-        
-        options_table.add_row("v", "View file")
-        options_table.add_row("r", "Return")
-        
-        self.console.print(Panel(options_table, title="Options", box=box.ROUNDED))
-        
-        # Get user choice
-        action_choice = Prompt.ask("Select an action", choices=["v", "r"], default="r")
-        
-        if action_choice == "v":
             # View file
-            file_num = Prompt.ask("Enter file number to view", default="1")
-            try:
-                file_index = int(file_num) - 1
-                if 0 <= file_index < len(files):
-                    self._view_file(files[file_index])
-                else:
-                    self.console.print("[yellow]Invalid file number.[/yellow]")
-            except ValueError:
-                self.console.print("[yellow]Invalid input. Please enter a number.[/yellow]")
-            
-            # Return to file display
-            self._display_and_manage_files(files, title)
+            file_index = self._ask_file_index(files, "view")
+            if file_index is not None:
+                self._view_file(files[file_index])
     
     def _view_file(self, file_info):
         """
@@ -1126,33 +2741,50 @@ Configure your Firecrawl instance in the Settings menu:
         Args:
             file_info: Dictionary containing file information.
         """
+        from rich.markdown import Markdown
+        from rich.syntax import Syntax
+        
         file_path = file_info["path"]
         file_name = file_info["name"]
+        self._ensure_metadata(file_info)
         
         try:
-            with open(file_path, "r", encoding="utf-8") as f:
-                content = f.read()
+            # Only a bounded prefix is read; one extra byte tells whether there is more
+            with open(file_path, "rb") as f:
+                raw = f.read(VIEW_MAX_BYTES + 1)
+            truncated = len(raw) > VIEW_MAX_BYTES
+            raw = raw[:VIEW_MAX_BYTES]
+            content = raw.decode("utf-8", errors="replace")
             
             # Determine the file type
-            if file_name.endswith(".json"):
-                # Parse and pretty-print JSON
+            if file_name.endswith(".json") and not truncated:
+                # Parse and pretty-print JSON; a truncated document is shown as text
                 try:
-                    parsed_json = json.loads(content)
-                    content = json.dumps(parsed_json, indent=2)
-                    syntax = Syntax(content, "json", theme="monokai", line_numbers=True)
-                except json.JSONDecodeError:
-                    syntax = Syntax(content, "text", theme="monokai", line_numbers=True)
+                    content = _json_dumpb(_json_loads(raw), indent=True).decode("utf-8")
+                    renderable = Syntax(content, "json", theme="monokai", line_numbers=True)
+                except ValueError:
+                    renderable = Syntax(content, "text", theme="monokai", line_numbers=True)
             elif file_name.endswith(".md"):
                 # Render markdown
-                self.console.print(Panel(Markdown(content), title=file_name, box=box.ROUNDED))
-                return
+                renderable = Markdown(content)
             elif file_name.endswith(".html"):
-                syntax = Syntax(content, "html", theme="monokai", line_numbers=True)
+                renderable = Syntax(content, "html", theme="monokai", line_numbers=True)
+            else:
+                renderable = Syntax(content, "text", theme="monokai", line_numbers=True)
+            
+            # Display file content with syntax highlighting. Large files go through
+            # the pager so they can be scrolled instead of flooding the terminal.
+            if len(content) > VIEW_PAGER_THRESHOLD:
+                with self.console.pager(styles=True):
+                    self.console.print(Panel(renderable, title=file_name, box=box.ROUNDED))
             else:
-                syntax = Syntax(content, "text", theme="monokai", line_numbers=True)
+                self.console.print(Panel(renderable, title=file_name, box=box.ROUNDED))
             
-            # Display file content with syntax highlighting
-            self.console.print(Panel(syntax, title=file_name, box=box.ROUNDED))
+            if truncated:
+                self.console.print(
+                    f"[yellow]Showing the first {VIEW_MAX_BYTES // (1 << 20)} MiB of "
+                    f"{file_info['size']:,} bytes. Open the file to see all of it.[/yellow]"
+                )
             
             # Display metadata if available
             if "metadata" in file_info:
@@ -1180,7 +2812,49 @@ Configure your Firecrawl instance in the Settings menu:
         except Exception as e:
             self.console.print(f"[yellow]Could not read file: {str(e)}[/yellow]")
     
-    def _handle_save_dialog(self, data, url, prefix="", format_type="json"):
+    def _get_save_location_options(self, export_type: str) -> Tuple[Panel, List[Optional[str]], List[str]]:
+        """
+        Get the save location panel for an export type, building it on first use.
+        
+        Args:
+            export_type: The export directory offered as the default location.
+            
+        Returns:
+            The panel, the directory for each numbered option in order (None
+            stands for the custom location) and the option numbers as prompt choices.
+        """
+        cached = self._save_location_options.get(export_type)
+        if cached is not None:
+            return cached
+        
+        labels = [
+            f"Default ({self.export_dirs[export_type]})",
+            f"Main exports folder ({self.exports_base_dir})"
+        ]
+        locations: List[Optional[str]] = [self.export_dirs[export_type], self.exports_base_dir]
+        
+        for name, path in self.export_dirs.items():
+            if name != export_type:  # Skip the default one as it's already option 1
+                labels.append(f"{name.capitalize()} folder ({path})")
+                locations.append(path)
+        
+        labels.append("Custom location")
+        locations.append(None)
+        
+        # Create a table for save location options
+        save_options = Table(show_header=False, box=box.SIMPLE)
+        save_options.add_column("Option", style="cyan")
+        save_options.add_column("Location", style="green")
+        
+        for i, label in enumerate(labels, 1):
+            save_options.add_row(str(i), label)
+        
+        choices = [str(i) for i in range(1, len(locations) + 1)]
+        cached = (Panel(save_options, title="Choose Save Location", box=box.ROUNDED), locations, choices)
+        self._save_location_options[export_type] = cached
+        return cached
+    
+    def _handle_save_dialog(self, data, url, prefix="", format_type="json", writer=None):
         """
         Handle the save dialog consistently across all functions.
         
@@ -1189,6 +2863,8 @@ Configure your Firecrawl instance in the Settings menu:
             url: The URL that was processed.
             prefix: A prefix for the filename (e.g., "crawl_", "map_").
             format_type: The format to save the data in.
+            writer: Optional callable taking (directory, filename) that writes the
+                export itself and returns the saved path, used instead of `data`.
             
         Returns:
             bool: Whether the save was successful.
@@ -1199,48 +2875,26 @@ Configure your Firecrawl instance in the Settings menu:
             export_type = "crawls"
         elif prefix == "map_":
             export_type = "maps"
-        elif prefix == "":
+        elif prefix in ("", "batch_"):
             export_type = "scrapes"
         
         # Display save options in a panel
         self.console.print(Panel("[bold]Save Options[/bold]", box=box.ROUNDED))
         
-        # Create a table for save location options
-        save_options = Table(show_header=False, box=box.SIMPLE)
-        save_options.add_column("Option", style="cyan")
-        save_options.add_column("Location", style="green")
-        
-        save_options.add_row("1", f"Default ({self.export_dirs[export_type]})")
-        save_options.add_row("2", f"Main exports folder ({self.exports_base_dir})")
-        
-        for i, (name, path) in enumerate(self.export_dirs.items(), 3):
-            if name != export_type:  # Skip the default one as it's already option 1
-                save_options.add_row(str(i), f"{name.capitalize()} folder ({path})")
-        
-        save_options.add_row(str(len(self.export_dirs) + 2), "Custom location")
-        
-        self.console.print(Panel(save_options, title="Choose Save Location", box=box.ROUNDED))
+        save_options_panel, locations, choices = self._get_save_location_options(export_type)
+        self.console.print(save_options_panel)
         
         # Get user choice
-        choices = [str(i) for i in range(1, len(self.export_dirs) + 3)]
         dir_choice = Prompt.ask("Select save location", choices=choices, default="1")
         
         # Set the save directory based on user choice
-        if dir_choice == "1":
-            save_dir = self.export_dirs[export_type]
-        elif dir_choice == "2":
-            save_dir = self.exports_base_dir
-        elif dir_choice == str(len(self.export_dirs) + 2):
+        save_dir = locations[int(dir_choice) - 1]
+        if save_dir is None:
             save_dir = Prompt.ask("Enter custom directory path", default=self.default_save_dir)
-        else:
-            # Get the directory name from the option number
-            dir_index = int(dir_choice) - 3
-            dir_name = list(self.export_dirs.keys())[dir_index]
-            save_dir = self.export_dirs[dir_name]
         
         # Generate default filename based on URL and timestamp
-        domain = url.replace("https://", "").replace("http://", "").split("/")[0]
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        domain = _url_to_domain(url)
+        timestamp = time.strftime("%Y%m%d_%H%M%S")
         default_filename = f"{prefix}{domain}_{timestamp}"
         
         # Ask for filename
@@ -1257,46 +2911,52 @@ Configure your Firecrawl instance in the Settings menu:
             if description:
                 metadata["description"] = description
             if tags:
-                metadata["tags"] = [tag.strip() for tag in tags.split(",") if tag.strip()]
+                metadata["tags"] = _parse_csv(tags)
             
-            # If we have metadata and the format is JSON, add it to the data
+            # If we have metadata and the format is JSON, add it to the data. Shallow
+            # copies leave the caller's (possibly cached) response untouched without
+            # re-serializing it.
             if metadata and format_type == "json" and isinstance(data, dict):
-                if "metadata" not in data:
-                    data["metadata"] = {}
-                data["metadata"].update({
-                    "export_info": metadata,
-                    "export_date": datetime.now().isoformat(),
-                    "source_url": url
-                })
+                data = {
+                    **data,
+                    "metadata": {
+                        **data.get("metadata", {}),
+                        "export_info": metadata,
+                        "export_date": datetime.now().isoformat(),
+                        "source_url": url
+                    }
+                }
         
         # Save the content
         try:
-            saved_path = self.client.save_to_file(data, save_dir, filename, format_type)
+            if writer is not None:
+                saved_path = writer(save_dir, filename)
+            else:
+                saved_path = self.client.save_to_file(data, save_dir, filename, format_type)
             
             # Create a metadata sidecar file for non-JSON formats
             if metadata and (format_type != "json" or not isinstance(data, dict)):
                 metadata_file = f"{os.path.splitext(saved_path)[0]}.meta.json"
-                with open(metadata_file, "w", encoding="utf-8") as f:
-                    json.dump({
-                        "description": metadata.get("description", ""),
-                        "tags": metadata.get("tags", []),
-                        "export_date": datetime.now().isoformat(),
-                        "source_url": url,
-                        "format": format_type
-                    }, f, indent=2)
+                payload = _json_dumpb({
+                    "description": metadata.get("description", ""),
+                    "tags": metadata.get("tags", []),
+                    "export_date": datetime.now().isoformat(),
+                    "source_url": url,
+                    "format": format_type
+                }, indent=True)
+                # A single write of the encoded bytes, without a text wrapper
+                fd = os.open(metadata_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+                try:
+                    os.write(fd, payload)
+                finally:
+                    os.close(fd)
             
             self.console.print(f"[bold green]Results saved to:[/bold green] {saved_path}")
             
             # Offer to open the directory
             if Confirm.ask("Open the directory containing this file?", default=False):
                 try:
-                    # Use the appropriate command based on the OS
-                    if sys.platform == "win32":
-                        os.startfile(save_dir)
-                    elif sys.platform == "darwin":  # macOS
-                        os.system(f"open '{save_dir}'")
-                    else:  # Linux
-                        os.system(f"xdg-open '{save_dir}'")
+                    self._open_in_filemanager(save_dir)
                 except Exception as e:
                     self.console.print(f"[yellow]Could not open directory: {str(e)}[/yellow]")
             
@@ -1308,15 +2968,21 @@ Configure your Firecrawl instance in the Settings menu:
     def run(self):
         """Run the application."""
         self.console.clear()
+        shown_welcome = False
         
         while self.running:
             self.console.clear()
             self.display_header()
-            self.display_welcome()
+            
+            # The welcome screen is only shown on the first menu display
+            if not shown_welcome:
+                self.display_welcome()
+                shown_welcome = True
+            
             self.display_menu()
             
             try:
-                choice = Prompt.ask("Choose an option", choices=["1", "2", "3", "4", "5", "6", "q"], default="1")
+                choice = Prompt.ask("Choose an option", choices=["1", "2", "3", "4", "5", "6", "7", "q"], default="1")
                 
                 if choice == "1":
                     self.scrape_url()
@@ -1330,6 +2996,8 @@ Configure your Firecrawl instance in the Settings menu:
                     self.help()
                 elif choice == "6":
                     self.manage_exports()
+                elif choice == "7":
+                    self.batch_scrape()
                 elif choice.lower() == "q":
                     self.running = False
                     self.console.print("[bold green]Thank you for using Firecrawl Explorer![/bold green]")
@@ -1342,9 +3010,8 @@ Configure your Firecrawl instance in the Settings menu:
             except Exception as e:
                 # Handle any other unexpected errors
                 self.console.print(f"\n[bold red]An error occurred:[/bold red] {str(e)}")
-                self.console.print("[bold cyan]Press Enter to continue...[/bold cyan]")
                 try:
-                    input()
+                    self.console.input("[bold cyan]Press Enter to continue...[/bold cyan]")
                 except (EOFError, KeyboardInterrupt):
                     self.running = False
                     break
@@ -1352,6 +3019,13 @@ Configure your Firecrawl instance in the Settings menu:
 
 def main():
     """Main entry point."""
+    # uvloop speeds up the asyncio loop used by batch operations; it is optional
+    try:
+        import uvloop
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    except ImportError:
+        pass
+    
     explorer = FirecrawlExplorer()
     explorer.run()
 